@@ -2,189 +2,202 @@
 Script to add sample data for demonstration purposes
 """
 import asyncio
+import os
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from database import SessionLocal, engine
-from models import Base, Member, Trade, Committee, CommitteeMembership
+from database import SessionLocal, engine, insert_ignore_conflicts
+from models import Base, Member, Trade, Committee, CommitteeMembership, TRADE_DEDUP_COLUMNS
 from datetime import datetime, timedelta
 import random
-
-# Create tables
-Base.metadata.create_all(bind=engine)
+import numpy as np
 
 def add_sample_data():
     db = SessionLocal()
     
     try:
-        # Add sample members
-        members_data = [
-            {
-                "name": "Nancy Pelosi",
-                "chamber": "House",
-                "state": "CA",
-                "party": "Democrat",
-                "district": "11",
-                "office": "H-312",
-                "phone": "(202) 225-4965",
-                "email": "nancy.pelosi@mail.house.gov",
-                "website": "https://pelosi.house.gov"
-            },
-            {
-                "name": "Mitch McConnell",
-                "chamber": "Senate",
-                "state": "KY",
-                "party": "Republican",
-                "office": "S-230",
-                "phone": "(202) 224-2541",
-                "email": "mitch.mcconnell@senate.gov",
-                "website": "https://www.mcconnell.senate.gov"
-            },
-            {
-                "name": "Chuck Schumer",
-                "chamber": "Senate",
-                "state": "NY",
-                "party": "Democrat",
-                "office": "S-322",
-                "phone": "(202) 224-6542",
-                "email": "chuck.schumer@senate.gov",
-                "website": "https://www.schumer.senate.gov"
-            },
-            {
-                "name": "Kevin McCarthy",
-                "chamber": "House",
-                "state": "CA",
-                "party": "Republican",
-                "district": "20",
-                "office": "H-2468",
-                "phone": "(202) 225-2915",
-                "email": "kevin.mccarthy@mail.house.gov",
-                "website": "https://kevinmccarthy.house.gov"
-            },
-            {
-                "name": "Elizabeth Warren",
-                "chamber": "Senate",
-                "state": "MA",
-                "party": "Democrat",
-                "office": "S-309",
-                "phone": "(202) 224-4543",
-                "email": "elizabeth.warren@senate.gov",
-                "website": "https://www.warren.senate.gov"
-            }
-        ]
-        
-        members = []
-        for member_data in members_data:
-            member = Member(**member_data)
-            db.add(member)
-            db.flush()
-            members.append(member)
-        
-        # Add sample committees
-        committees_data = [
-            {
-                "name": "House Committee on Financial Services",
-                "code": "HSBA",
-                "chamber": "House",
-                "subcommittee": False,
-                "description": "Oversees the entire financial services industry"
-            },
-            {
-                "name": "Senate Committee on Banking, Housing, and Urban Affairs",
-                "code": "SSBK",
-                "chamber": "Senate",
-                "subcommittee": False,
-                "description": "Oversees banking, housing, and urban affairs"
-            },
-            {
-                "name": "House Committee on Energy and Commerce",
-                "code": "HSIF",
-                "chamber": "House",
-                "subcommittee": False,
-                "description": "Oversees telecommunications, consumer protection, food and drug safety"
-            },
-            {
-                "name": "Senate Committee on Finance",
-                "code": "SSFI",
-                "chamber": "Senate",
-                "subcommittee": False,
-                "description": "Oversees taxation, revenue, and other financial matters"
+        # One transaction for the whole load; commits on success, rolls back on error
+        with db.begin():
+            now = datetime.utcnow()
+            
+            # Add sample members
+            members_data = [
+                {
+                    "name": "Nancy Pelosi",
+                    "chamber": "House",
+                    "state": "CA",
+                    "party": "Democrat",
+                    "district": "11",
+                    "office": "H-312",
+                    "phone": "(202) 225-4965",
+                    "email": "nancy.pelosi@mail.house.gov",
+                    "website": "https://pelosi.house.gov"
+                },
+                {
+                    "name": "Mitch McConnell",
+                    "chamber": "Senate",
+                    "state": "KY",
+                    "party": "Republican",
+                    "office": "S-230",
+                    "phone": "(202) 224-2541",
+                    "email": "mitch.mcconnell@senate.gov",
+                    "website": "https://www.mcconnell.senate.gov"
+                },
+                {
+                    "name": "Chuck Schumer",
+                    "chamber": "Senate",
+                    "state": "NY",
+                    "party": "Democrat",
+                    "office": "S-322",
+                    "phone": "(202) 224-6542",
+                    "email": "chuck.schumer@senate.gov",
+                    "website": "https://www.schumer.senate.gov"
+                },
+                {
+                    "name": "Kevin McCarthy",
+                    "chamber": "House",
+                    "state": "CA",
+                    "party": "Republican",
+                    "district": "20",
+                    "office": "H-2468",
+                    "phone": "(202) 225-2915",
+                    "email": "kevin.mccarthy@mail.house.gov",
+                    "website": "https://kevinmccarthy.house.gov"
+                },
+                {
+                    "name": "Elizabeth Warren",
+                    "chamber": "Senate",
+                    "state": "MA",
+                    "party": "Democrat",
+                    "office": "S-309",
+                    "phone": "(202) 224-4543",
+                    "email": "elizabeth.warren@senate.gov",
+                    "website": "https://www.warren.senate.gov"
+                }
+            ]
+            
+            # RETURNING hands back the generated ids (in input order) for the FK rows below
+            members = db.scalars(
+                insert(Member).returning(Member.id, sort_by_parameter_order=True),
+                members_data
+            ).all()
+            
+            # Add sample committees
+            committees_data = [
+                {
+                    "name": "House Committee on Financial Services",
+                    "code": "HSBA",
+                    "chamber": "House",
+                    "subcommittee": False,
+                    "description": "Oversees the entire financial services industry"
+                },
+                {
+                    "name": "Senate Committee on Banking, Housing, and Urban Affairs",
+                    "code": "SSBK",
+                    "chamber": "Senate",
+                    "subcommittee": False,
+                    "description": "Oversees banking, housing, and urban affairs"
+                },
+                {
+                    "name": "House Committee on Energy and Commerce",
+                    "code": "HSIF",
+                    "chamber": "House",
+                    "subcommittee": False,
+                    "description": "Oversees telecommunications, consumer protection, food and drug safety"
+                },
+                {
+                    "name": "Senate Committee on Finance",
+                    "code": "SSFI",
+                    "chamber": "Senate",
+                    "subcommittee": False,
+                    "description": "Oversees taxation, revenue, and other financial matters"
+                }
+            ]
+            
+            committees = db.scalars(
+                insert(Committee).returning(Committee.id, sort_by_parameter_order=True),
+                committees_data
+            ).all()
+            
+            # Add committee memberships
+            committee_memberships = [
+                {"member": members[0], "committee": committees[0], "position": "Member"},
+                {"member": members[1], "committee": committees[1], "position": "Ranking Member"},
+                {"member": members[2], "committee": committees[1], "position": "Chair"},
+                {"member": members[3], "committee": committees[0], "position": "Member"},
+                {"member": members[4], "committee": committees[3], "position": "Member"},
+            ]
+            
+            db.execute(insert(CommitteeMembership), [
+                {
+                    "member_id": membership_data["member"],
+                    "committee_id": membership_data["committee"],
+                    "position": membership_data["position"],
+                    "start_date": now - timedelta(days=365)
+                }
+                for membership_data in committee_memberships
+            ])
+            
+            # Add sample trades
+            companies = {
+                "AAPL": "Apple Inc.",
+                "MSFT": "Microsoft Corporation",
+                "GOOGL": "Alphabet Inc.",
+                "TSLA": "Tesla Inc.",
+                "AMZN": "Amazon.com Inc.",
+                "NVDA": "NVIDIA Corporation",
+                "META": "Meta Platforms Inc.",
+                "NFLX": "Netflix Inc.",
+                "DIS": "Walt Disney Company",
+                "V": "Visa Inc."
             }
-        ]
-        
-        committees = []
-        for committee_data in committees_data:
-            committee = Committee(**committee_data)
-            db.add(committee)
-            db.flush()
-            committees.append(committee)
-        
-        # Add committee memberships
-        committee_memberships = [
-            {"member": members[0], "committee": committees[0], "position": "Member"},
-            {"member": members[1], "committee": committees[1], "position": "Ranking Member"},
-            {"member": members[2], "committee": committees[1], "position": "Chair"},
-            {"member": members[3], "committee": committees[0], "position": "Member"},
-            {"member": members[4], "committee": committees[3], "position": "Member"},
-        ]
-        
-        for membership_data in committee_memberships:
-            membership = CommitteeMembership(
-                member_id=membership_data["member"].id,
-                committee_id=membership_data["committee"].id,
-                position=membership_data["position"],
-                start_date=datetime.utcnow() - timedelta(days=365)
-            )
-            db.add(membership)
-        
-        # Add sample trades
-        tickers = ["AAPL", "MSFT", "GOOGL", "TSLA", "AMZN", "NVDA", "META", "NFLX", "DIS", "V"]
-        companies = {
-            "AAPL": "Apple Inc.",
-            "MSFT": "Microsoft Corporation",
-            "GOOGL": "Alphabet Inc.",
-            "TSLA": "Tesla Inc.",
-            "AMZN": "Amazon.com Inc.",
-            "NVDA": "NVIDIA Corporation",
-            "META": "Meta Platforms Inc.",
-            "NFLX": "Netflix Inc.",
-            "DIS": "Walt Disney Company",
-            "V": "Visa Inc."
-        }
-        
-        transaction_types = ["Buy", "Sell", "Exchange"]
-        
-        # Generate trades for the last 6 months
-        for i in range(50):
-            member = random.choice(members)
-            ticker = random.choice(tickers)
-            transaction_type = random.choice(transaction_types)
-            transaction_date = datetime.utcnow() - timedelta(days=random.randint(1, 180))
+            tickers_companies = list(companies.items())
+            
+            transaction_types = ["Buy", "Sell", "Exchange"]
+            
+            # Generate trades for the last 6 months; all random draws are made up front
+            num_trades = 50
+            member_picks = random.choices(members, k=num_trades)
+            ticker_picks = random.choices(tickers_companies, k=num_trades)
+            type_picks = random.choices(transaction_types, k=num_trades)
+            transaction_offsets = np.random.randint(1, 181, num_trades).tolist()
+            filing_offsets = np.random.randint(1, 46, num_trades).tolist()
             
             # Generate amount ranges
-            amount_min = random.randint(1000, 50000)
-            amount_max = amount_min + random.randint(0, 10000)
+            amount_mins = np.random.randint(1000, 50001, num_trades)
+            amount_maxs = (amount_mins + np.random.randint(0, 10001, num_trades)).tolist()
+            amount_mins = amount_mins.tolist()
+            
+            trades = []
+            for i in range(num_trades):
+                ticker, company_name = ticker_picks[i]
+                transaction_type = type_picks[i]
+                transaction_date = now - timedelta(days=transaction_offsets[i])
+                
+                trades.append({
+                    "member_id": member_picks[i],
+                    "ticker": ticker,
+                    "company_name": company_name,
+                    "transaction_type": transaction_type,
+                    "transaction_date": transaction_date,
+                    "amount_min": amount_mins[i],
+                    "amount_max": amount_maxs[i],
+                    "description": f"Periodic Transaction Report - {transaction_type} {ticker}",
+                    "source": "Sample Data",
+                    "filing_date": transaction_date + timedelta(days=filing_offsets[i])
+                })
             
-            trade = Trade(
-                member_id=member.id,
-                ticker=ticker,
-                company_name=companies[ticker],
-                transaction_type=transaction_type,
-                transaction_date=transaction_date,
-                amount_min=amount_min,
-                amount_max=amount_max,
-                description=f"Periodic Transaction Report - {transaction_type} {ticker}",
-                source="Sample Data",
-                filing_date=transaction_date + timedelta(days=random.randint(1, 45))
-            )
-            db.add(trade)
+            # One batched multi-VALUES INSERT instead of 50 unit-of-work rows
+            db.execute(insert_ignore_conflicts(Trade, TRADE_DEDUP_COLUMNS), trades)
         
-        db.commit()
         print("Sample data added successfully!")
         
     except Exception as e:
         print(f"Error adding sample data: {e}")
-        db.rollback()
     finally:
         db.close()
 
 if __name__ == "__main__":
+    # Tables are normally created by the API on startup; set INIT_SCHEMA to create them here
+    if os.environ.get("INIT_SCHEMA"):
+        Base.metadata.create_all(bind=engine)
     add_sample_data()
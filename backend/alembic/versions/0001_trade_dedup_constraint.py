@@ -0,0 +1,44 @@
+"""Remove duplicate trades and add uq_trade_dedup
+
+Tables created before the constraint was added to models.Trade never got it
+from create_all, and ON CONFLICT inserts fail without it.
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from models import TRADE_DEDUP_COLUMNS
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    constraints = {c["name"] for c in inspector.get_unique_constraints("trades")}
+    if "uq_trade_dedup" in constraints:
+        return
+    
+    # Keep the first copy of each trade
+    columns = ", ".join(TRADE_DEDUP_COLUMNS)
+    op.execute(
+        f"DELETE FROM trades WHERE id NOT IN "
+        f"(SELECT min(id) FROM trades GROUP BY {columns})"
+    )
+    with op.batch_alter_table("trades") as batch_op:
+        batch_op.create_unique_constraint("uq_trade_dedup", list(TRADE_DEDUP_COLUMNS))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("trades") as batch_op:
+        batch_op.drop_constraint("uq_trade_dedup", type_="unique")
@@ -0,0 +1,56 @@
+"""Store trade amounts as whole-dollar BIGINT
+
+Tables created while the amount columns were Float keep that type under
+create_all, so convert them here, rounding to the nearest dollar.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Trade columns that moved from Float to BigInteger
+AMOUNT_COLUMNS = ("amount_min", "amount_max", "amount_exact", "exchange_from_amount")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    float_columns = [
+        column["name"]
+        for column in sa.inspect(bind).get_columns("trades")
+        if column["name"] in AMOUNT_COLUMNS and not isinstance(column["type"], sa.Integer)
+    ]
+    if not float_columns:
+        return
+    
+    # Postgres rounds in the ALTER itself; elsewhere batch mode copies the table
+    # with a plain CAST, which truncates, so round the stored values first
+    if bind.dialect.name != "postgresql":
+        for name in float_columns:
+            op.execute(f"UPDATE trades SET {name} = round({name}) WHERE {name} IS NOT NULL")
+    
+    with op.batch_alter_table("trades") as batch_op:
+        for name in float_columns:
+            batch_op.alter_column(
+                name,
+                existing_type=sa.Float(),
+                type_=sa.BigInteger(),
+                postgresql_using=f"round({name})::bigint"
+            )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("trades") as batch_op:
+        for name in AMOUNT_COLUMNS:
+            batch_op.alter_column(name, existing_type=sa.BigInteger(), type_=sa.Float())
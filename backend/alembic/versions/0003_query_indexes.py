@@ -0,0 +1,110 @@
+"""Replace single-column indexes with the query indexes in models.py
+
+create_all skips tables that already exist, so their indexes are synced here.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Single-column indexes superseded by the composite indexes below
+DROPPED_INDEXES = (
+    ("members", "ix_members_name", ["name"]),
+    ("trades", "ix_trades_transaction_date", ["transaction_date"]),
+)
+
+# (table, name, columns) of the plain indexes created on every backend
+INDEXES = (
+    ("members", "ix_members_chamber_name", ["chamber", "name"]),
+    ("members", "ix_members_name_id", ["name", "id"]),
+    ("trades", "ix_trades_source", ["source"]),
+    ("trades", "ix_trades_member_id_transaction_date", ["member_id", "transaction_date"]),
+    ("trades", "ix_trades_transaction_date_id", ["transaction_date", "id"]),
+    ("trades", "ix_trades_ticker_transaction_date", ["ticker", "transaction_date"]),
+)
+
+# Sources removed by clean_sample_data.py, covered by ix_trades_source_sample
+SAMPLE_SOURCES = ("Sample Data", "Realistic Trading Data", "Senate Sample Data", "House Sample Data")
+
+
+def _existing_indexes(bind) -> set:
+    inspector = sa.inspect(bind)
+    return {
+        index["name"]
+        for table in ("members", "trades")
+        for index in inspector.get_indexes(table)
+    }
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    existing = _existing_indexes(bind)
+    
+    for table, name, columns in DROPPED_INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name=table)
+    
+    for table, name, columns in INDEXES:
+        if name not in existing:
+            op.create_index(name, table, columns)
+    
+    if bind.dialect.name != "postgresql":
+        return
+    
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    if "ix_members_name_trgm" not in existing:
+        op.create_index(
+            "ix_members_name_trgm",
+            "members",
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"}
+        )
+    if "ix_trades_ticker_trgm" not in existing:
+        op.create_index(
+            "ix_trades_ticker_trgm",
+            "trades",
+            ["ticker"],
+            postgresql_using="gin",
+            postgresql_ops={"ticker": "gin_trgm_ops"}
+        )
+    if "ix_trades_source_sample" not in existing:
+        op.create_index(
+            "ix_trades_source_sample",
+            "trades",
+            ["source"],
+            postgresql_where=sa.column("source").in_(SAMPLE_SOURCES)
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    existing = _existing_indexes(bind)
+    
+    for name, table in (
+        ("ix_members_name_trgm", "members"),
+        ("ix_trades_ticker_trgm", "trades"),
+        ("ix_trades_source_sample", "trades"),
+    ):
+        if name in existing:
+            op.drop_index(name, table_name=table)
+    
+    for table, name, columns in INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name=table)
+    
+    for table, name, columns in DROPPED_INDEXES:
+        if name not in existing:
+            op.create_index(name, table, columns)
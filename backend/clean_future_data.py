@@ -6,8 +6,9 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from database import get_db
+from database import SessionLocal
 from models import Trade, Member, Committee, CommitteeMembership
+from sqlalchemy import select, func
 from datetime import datetime
 import logging
 
@@ -18,21 +19,28 @@ def clean_future_and_suspicious_data():
     """
     Remove trades with future dates and suspicious sources
     """
-    db = next(get_db())
+    db = SessionLocal()
     
     try:
         current_time = datetime.now()
         
         # Remove trades with future dates
-        future_trades = db.query(Trade).filter(
-            Trade.transaction_date > current_time
-        ).all()
+        future_filter = Trade.transaction_date > current_time
         
-        logger.info(f"Found {len(future_trades)} trades with future dates to remove")
+        # The preview is log-only: stream plain column tuples instead of Trade objects
+        if logger.isEnabledFor(logging.INFO):
+            future_trades = db.query(
+                Member.name,
+                Trade.ticker,
+                Trade.transaction_type,
+                Trade.transaction_date
+            ).join(Trade.member).filter(future_filter).yield_per(1000)
+            
+            for member_name, ticker, transaction_type, transaction_date in future_trades:
+                logger.info(f"Removing future trade: {member_name} - {ticker} {transaction_type} on {transaction_date}")
         
-        for trade in future_trades:
-            logger.info(f"Removing future trade: {trade.member.name} - {trade.ticker} {trade.transaction_type} on {trade.transaction_date}")
-            db.delete(trade)
+        removed_future = db.query(Trade).filter(future_filter).delete(synchronize_session=False)
+        logger.info(f"Removed {removed_future} trades with future dates")
         
         # Remove trades from suspicious sources
         suspicious_sources = [
@@ -42,49 +50,53 @@ def clean_future_and_suspicious_data():
             "Realistic Trading Data"
         ]
         
-        for source in suspicious_sources:
-            source_trades = db.query(Trade).filter(Trade.source == source).all()
-            if source_trades:
-                logger.info(f"Removing {len(source_trades)} trades from suspicious source: {source}")
-                for trade in source_trades:
-                    db.delete(trade)
+        source_trades = db.query(Trade).filter(
+            Trade.source.in_(suspicious_sources)
+        ).delete(synchronize_session=False)
+        if source_trades:
+            logger.info(f"Removed {source_trades} trades from suspicious sources")
         
         # Remove trades with unrealistic descriptions
         fake_descriptions = db.query(Trade).filter(
-            Trade.description.like("%Senate disclosure%") |
-            Trade.description.like("%Scraped from House%") |
-            Trade.description.like("%sample%") |
-            Trade.description.like("%realistic%")
-        ).all()
+            Trade.description.regexp_match("Senate disclosure|Scraped from House|sample|realistic")
+        ).delete(synchronize_session=False)
         
         if fake_descriptions:
-            logger.info(f"Removing {len(fake_descriptions)} trades with fake descriptions")
-            for trade in fake_descriptions:
-                db.delete(trade)
+            logger.info(f"Removed {fake_descriptions} trades with fake descriptions")
         
         db.commit()
         logger.info("Suspicious data cleaned successfully!")
         
-        # Show remaining data
-        remaining_trades = db.query(Trade).count()
-        remaining_members = db.query(Member).count()
-        remaining_committees = db.query(Committee).count()
-        
-        logger.info(f"Remaining data:")
-        logger.info(f"  - Trades: {remaining_trades}")
-        logger.info(f"  - Members: {remaining_members}")
-        logger.info(f"  - Committees: {remaining_committees}")
-        
-        # Show remaining sources
-        remaining_sources = db.query(Trade.source).distinct().all()
-        logger.info(f"Remaining data sources:")
-        for source in remaining_sources:
-            count = db.query(Trade).filter(Trade.source == source[0]).count()
-            logger.info(f"  - {source[0]}: {count} trades")
+        # Remaining totals are only reported, so skip the aggregates when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            # Show remaining data
+            remaining_trades, remaining_members, remaining_committees = db.execute(
+                select(
+                    select(func.count()).select_from(Trade).scalar_subquery(),
+                    select(func.count()).select_from(Member).scalar_subquery(),
+                    select(func.count()).select_from(Committee).scalar_subquery()
+                )
+            ).one()
+            
+            logger.info(f"Remaining data:")
+            logger.info(f"  - Trades: {remaining_trades}")
+            logger.info(f"  - Members: {remaining_members}")
+            logger.info(f"  - Committees: {remaining_committees}")
+            
+            # Show remaining sources
+            remaining_sources = db.query(
+                Trade.source,
+                func.count(Trade.id)
+            ).group_by(Trade.source).all()
+            logger.info(f"Remaining data sources:")
+            for source, count in remaining_sources:
+                logger.info(f"  - {source}: {count} trades")
         
     except Exception as e:
         logger.error(f"Error cleaning suspicious data: {e}")
         db.rollback()
+    finally:
+        db.close()
 
 if __name__ == "__main__":
     clean_future_and_suspicious_data()
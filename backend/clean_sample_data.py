@@ -7,9 +7,9 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from database import get_db
+from database import SessionLocal
 from models import Trade, Member, Committee, CommitteeMembership
-from sqlalchemy import and_
+from sqlalchemy import and_, select, func
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -19,7 +19,7 @@ def clean_sample_data():
     """
     Remove sample data from the database
     """
-    db = next(get_db())
+    db = SessionLocal()
     
     try:
         # Remove trades with sample data sources
@@ -32,41 +32,41 @@ def clean_sample_data():
         
         sample_trades = db.query(Trade).filter(
             Trade.source.in_(sample_sources)
-        ).all()
+        ).delete(synchronize_session=False)
         
-        logger.info(f"Found {len(sample_trades)} sample trades to remove")
-        
-        for trade in sample_trades:
-            db.delete(trade)
+        logger.info(f"Removed {sample_trades} sample trades")
         
         # Also remove trades with unrealistic descriptions
         sample_descriptions = db.query(Trade).filter(
-            Trade.description.like("%sample%") |
-            Trade.description.like("%realistic%") |
-            Trade.description.like("%generated%")
-        ).all()
-        
-        logger.info(f"Found {len(sample_descriptions)} trades with sample descriptions to remove")
+            Trade.description.regexp_match("sample|realistic|generated")
+        ).delete(synchronize_session=False)
         
-        for trade in sample_descriptions:
-            db.delete(trade)
+        logger.info(f"Removed {sample_descriptions} trades with sample descriptions")
         
         db.commit()
         logger.info("Sample data cleaned successfully!")
         
-        # Show remaining data
-        remaining_trades = db.query(Trade).count()
-        remaining_members = db.query(Member).count()
-        remaining_committees = db.query(Committee).count()
-        
-        logger.info(f"Remaining data:")
-        logger.info(f"  - Trades: {remaining_trades}")
-        logger.info(f"  - Members: {remaining_members}")
-        logger.info(f"  - Committees: {remaining_committees}")
+        # Remaining totals are only reported, so skip the aggregates when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            # Show remaining data
+            remaining_trades, remaining_members, remaining_committees = db.execute(
+                select(
+                    select(func.count()).select_from(Trade).scalar_subquery(),
+                    select(func.count()).select_from(Member).scalar_subquery(),
+                    select(func.count()).select_from(Committee).scalar_subquery()
+                )
+            ).one()
+            
+            logger.info(f"Remaining data:")
+            logger.info(f"  - Trades: {remaining_trades}")
+            logger.info(f"  - Members: {remaining_members}")
+            logger.info(f"  - Committees: {remaining_committees}")
         
     except Exception as e:
         logger.error(f"Error cleaning sample data: {e}")
         db.rollback()
+    finally:
+        db.close()
 
 if __name__ == "__main__":
     clean_sample_data()
@@ -7,12 +7,13 @@ import asyncio
 import sys
 import os
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session, joinedload
 
 # Add the backend directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from database import SessionLocal
+from database import BulkSession
 from data_collector import collect_congress_data
 from models import Trade, Member, Committee
 import logging
@@ -28,15 +29,20 @@ async def collect_all_data():
     """
     Collect data from all available sources
     """
-    db = SessionLocal()
+    db = BulkSession()
     
     try:
         logger.info("Starting real data collection...")
         
+        # Trade/member/committee totals in a single round-trip
+        counts_stmt = select(
+            select(func.count()).select_from(Trade).scalar_subquery(),
+            select(func.count()).select_from(Member).scalar_subquery(),
+            select(func.count()).select_from(Committee).scalar_subquery()
+        )
+        
         # Get current stats before collection
-        initial_trades = db.query(Trade).count()
-        initial_members = db.query(Member).count()
-        initial_committees = db.query(Committee).count()
+        initial_trades, initial_members, initial_committees = db.execute(counts_stmt).one()
         
         logger.info(f"Initial data: {initial_trades} trades, {initial_members} members, {initial_committees} committees")
         
@@ -44,18 +50,18 @@ async def collect_all_data():
         await collect_congress_data(db)
         
         # Get stats after collection
-        final_trades = db.query(Trade).count()
-        final_members = db.query(Member).count()
-        final_committees = db.query(Committee).count()
+        final_trades, final_members, final_committees = db.execute(counts_stmt).one()
         
         logger.info(f"Final data: {final_trades} trades, {final_members} members, {final_committees} committees")
         logger.info(f"Added: {final_trades - initial_trades} trades, {final_members - initial_members} members, {final_committees - initial_committees} committees")
         
         # Show some sample data
-        recent_trades = db.query(Trade).order_by(Trade.transaction_date.desc()).limit(5).all()
+        recent_trades = db.query(Trade).options(
+            joinedload(Trade.member)
+        ).order_by(Trade.transaction_date.desc()).limit(5).yield_per(1000)
         logger.info("Recent trades:")
         for trade in recent_trades:
-            member = db.query(Member).filter(Member.id == trade.member_id).first()
+            member = trade.member
             logger.info(f"  {member.name if member else 'Unknown'} - {trade.ticker} {trade.transaction_type} on {trade.transaction_date.strftime('%Y-%m-%d')}")
         
     except Exception as e:
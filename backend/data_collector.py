@@ -1,29 +1,133 @@
 """
 Data collection module for Congressional trading data from free sources
 """
-import requests
-import json
+import httpx
+import orjson
 import asyncio
+import random
+import re
+import time
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import or_, insert, text
+from ciso8601 import parse_datetime
 import logging
 
-from models import Member, Trade, Committee, CommitteeMembership
+from database import insert_ignore_conflicts
+from models import Member, Trade, Committee, CommitteeMembership, FetchCache, TRADE_DEDUP_COLUMNS
 from schemas import MemberCreate, TradeCreate, CommitteeCreate
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of buffered trade rows per bulk INSERT
+TRADE_BATCH_SIZE = 10000
+
+# Upper bound on files fetched at once from a single host
+MAX_CONCURRENT_FETCHES = 64
+
+# Number of concurrent Senate Stock Watcher file fetchers
+SENATE_FETCH_WORKERS = 32
+
+# Retry policy for transient HTTP failures (rate limiting and 5xx)
+MAX_FETCH_ATTEMPTS = 5
+MAX_RETRY_DELAY = 60
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Anything that is not a letter or digit is dropped from member name keys
+NON_ALNUM_PATTERN = re.compile(r'[\W_]+')
+
+# Translation table deleting currency symbols and thousands separators from amounts
+AMOUNT_STRIP_TABLE = str.maketrans('', '', '$,')
+
+@lru_cache(maxsize=4096)
+def normalize_member_name(name: str) -> str:
+    """
+    Normalize a member name for lookups: lowercase with punctuation and whitespace removed
+    """
+    return NON_ALNUM_PATTERN.sub('', name.lower())
+
+async def get_with_retry(session: httpx.AsyncClient, url: str, headers: Optional[Dict] = None) -> httpx.Response:
+    """
+    GET a URL, retrying connection errors, rate limiting and transient server errors with exponential backoff
+    """
+    for attempt in range(MAX_FETCH_ATTEMPTS):
+        last_attempt = attempt == MAX_FETCH_ATTEMPTS - 1
+        try:
+            response = await session.get(url, headers=headers)
+        except httpx.TransportError as e:
+            if last_attempt:
+                raise
+            logger.warning(f"Request to {url} failed ({e}), retrying")
+            await asyncio.sleep(2 ** attempt + random.random())
+            continue
+        
+        if last_attempt or not should_retry(response):
+            return response
+        
+        delay = retry_delay(response, attempt)
+        logger.warning(f"Request to {url} returned {response.status_code}, retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+def should_retry(response: httpx.Response) -> bool:
+    """
+    Whether a response is a transient failure worth retrying
+    """
+    if response.status_code in RETRY_STATUS_CODES:
+        return True
+    # GitHub signals an exhausted rate limit with 403 and zero remaining requests
+    return response.status_code == 403 and response.headers.get('X-RateLimit-Remaining') == '0'
+
+def retry_delay(response: httpx.Response, attempt: int) -> float:
+    """
+    Seconds to wait before retrying, honoring Retry-After / X-RateLimit-Reset when present
+    """
+    retry_after = response.headers.get('Retry-After')
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), MAX_RETRY_DELAY)
+    
+    rate_limit_reset = response.headers.get('X-RateLimit-Reset')
+    if rate_limit_reset and rate_limit_reset.isdigit():
+        return min(max(float(rate_limit_reset) - time.time(), 0), MAX_RETRY_DELAY)
+    
+    return min(2 ** attempt + random.random(), MAX_RETRY_DELAY)
+
 class CongressDataCollector:
     def __init__(self, db: Session):
         self.db = db
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Congressional Trading Dashboard (Educational Use)'
-        })
+        # Normalized Senate member name -> member id, loaded on first use
+        self._senate_member_ids: Optional[Dict[str, int]] = None
+        # (normalized name, chamber) of stored members, loaded on first use
+        self._existing_member_keys: Optional[Set[Tuple[str, str]]] = None
+        # Codes of stored committees, loaded on first use
+        self._existing_committee_codes: Optional[Set[str]] = None
+        self.session = httpx.AsyncClient(
+            headers={
+                'User-Agent': 'Congressional Trading Dashboard (Educational Use)'
+            },
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=MAX_CONCURRENT_FETCHES,
+                keepalive_expiry=30
+            ),
+            timeout=30.0,
+            follow_redirects=True
+        )
+    
+    async def close(self):
+        """
+        Close the pooled HTTP client
+        """
+        await self.session.aclose()
+    
+    async def _get_with_retry(self, url: str, headers: Optional[Dict] = None) -> httpx.Response:
+        """
+        GET a URL on the pooled client with the shared retry policy
+        """
+        return await get_with_retry(self.session, url, headers=headers)
     
     async def collect_senate_stock_data(self):
         """
@@ -35,95 +139,185 @@ class CongressDataCollector:
             # GitHub API endpoint for the repository
             url = "https://api.github.com/repos/timothycarambat/senate-stock-watcher-data/contents/data"
             
-            response = self.session.get(url)
+            response = await self._get_with_retry(url)
             if response.status_code == 200:
-                files = response.json()
+                files = orjson.loads(response.content)
+                
+                # Validators from previous runs, so unchanged files come back as 304
+                validators = {
+                    cached.url: cached
+                    for cached in self.db.query(FetchCache)
+                }
                 
+                url_queue = asyncio.Queue()
                 for file_info in files:
                     if file_info['name'].endswith('.json'):
-                        await self._process_senate_file(file_info['download_url'])
+                        download_url = file_info['download_url']
+                        url_queue.put_nowait((download_url, validators.get(download_url)))
+                
+                # Fetch workers feed parsed files to a single DB writer; the bounded
+                # queue keeps fetching from running far ahead of the inserts
+                trade_queue = asyncio.Queue(maxsize=SENATE_FETCH_WORKERS)
+                writer = asyncio.create_task(self._write_senate_trades(trade_queue))
+                workers = [
+                    asyncio.create_task(self._fetch_senate_files(url_queue, trade_queue))
+                    for _ in range(min(SENATE_FETCH_WORKERS, url_queue.qsize()))
+                ]
+                
+                fetching = asyncio.gather(*workers)
+                try:
+                    # The writer only finishes before the fetchers by failing, in which case the
+                    # fetchers would block forever on the full queue; stop waiting and re-raise
+                    done, _ = await asyncio.wait({fetching, writer}, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        task.result()
+                    await trade_queue.put(None)
+                    await writer
+                finally:
+                    # Cancelling the gather cancels the fetchers it wraps; awaiting both
+                    # consumes their cancellation instead of leaving it unretrieved
+                    fetching.cancel()
+                    writer.cancel()
+                    await asyncio.gather(fetching, writer, return_exceptions=True)
             else:
                 logger.warning(f"Failed to access Senate Stock Watcher data: {response.status_code}")
                         
         except Exception as e:
             logger.error(f"Error collecting Senate Stock Watcher data: {e}")
     
-    async def _process_senate_file(self, download_url: str):
+    async def _fetch_senate_files(self, url_queue: asyncio.Queue, trade_queue: asyncio.Queue):
         """
-        Process individual Senate stock data file
+        Worker: fetch and parse Senate stock data files until the URL queue is empty
         """
-        try:
-            response = self.session.get(download_url)
-            if response.status_code == 200:
-                data = response.json()
-                
-                for trade_data in data:
-                    await self._save_senate_trade(trade_data)
-                    
-        except Exception as e:
-            logger.error(f"Error processing Senate file {download_url}: {e}")
+        while True:
+            try:
+                download_url, cached = url_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            
+            headers = {}
+            if cached is not None:
+                if cached.etag:
+                    headers['If-None-Match'] = cached.etag
+                if cached.last_modified:
+                    headers['If-Modified-Since'] = cached.last_modified
+            
+            try:
+                response = await self._get_with_retry(download_url, headers=headers)
+                if response.status_code == 304:
+                    # Unchanged since the last run
+                    continue
+                if response.status_code == 200:
+                    await trade_queue.put((download_url, response.headers, orjson.loads(response.content)))
+            except Exception as e:
+                logger.error(f"Error processing Senate file {download_url}: {e}")
     
-    async def _save_senate_trade(self, trade_data: Dict):
+    async def _write_senate_trades(self, trade_queue: asyncio.Queue):
         """
-        Save individual Senate trade to database
+        Single writer: turn parsed Senate files into trade rows and insert them in batches
         """
-        try:
-            # Extract member information
-            senator_name = trade_data.get('senator', '')
-            if not senator_name:
-                return
+        rows = []
+        while True:
+            item = await trade_queue.get()
+            if item is None:
+                break
+            download_url, headers, data = item
+            
+            for trade_data in data:
+                try:
+                    member_id = self._get_senate_member_id(trade_data)
+                    if member_id is None:
+                        continue
+                    rows.append(self._build_senate_trade_dict(trade_data, member_id))
+                except Exception as e:
+                    logger.error(f"Error saving Senate trade: {e}")
                 
-            # Find or create member
-            member = self.db.query(Member).filter(
-                and_(
-                    Member.name.ilike(f"%{senator_name}%"),
+                if len(rows) >= TRADE_BATCH_SIZE:
+                    self._insert_trades(rows)
+                    rows.clear()
+            
+            # Remember the validators; committed together with the file's trades
+            self.db.merge(FetchCache(
+                url=download_url,
+                etag=headers.get('ETag'),
+                last_modified=headers.get('Last-Modified')
+            ))
+        
+        if rows:
+            self._insert_trades(rows)
+    
+    def _insert_trades(self, rows: List[Dict]):
+        """
+        Insert trade rows in one batch, letting the database skip already-stored trades
+        """
+        self.db.execute(insert_ignore_conflicts(Trade, TRADE_DEDUP_COLUMNS), rows)
+    
+    def _get_senate_member_id(self, trade_data: Dict) -> Optional[int]:
+        """
+        Find or create the Senate member for a trade and return its id
+        """
+        # Extract member information
+        senator_name = trade_data.get('senator', '')
+        if not senator_name:
+            return None
+            
+        # Load every Senate member once instead of querying per trade
+        if self._senate_member_ids is None:
+            self._senate_member_ids = {
+                normalize_member_name(name): member_id
+                for member_id, name in self.db.query(Member.id, Member.name).filter(
                     Member.chamber == "Senate"
                 )
-            ).first()
-            
-            if not member:
-                # Create new Senate member
-                member_data = MemberCreate(
-                    name=senator_name,
-                    chamber="Senate",
-                    state=trade_data.get('state', ''),
-                    party=trade_data.get('party', '')
-                )
-                member = Member(**member_data.dict())
-                self.db.add(member)
-                self.db.flush()
-            
-            # Create trade record
-            trade_data_dict = {
-                'member_id': member.id,
-                'ticker': trade_data.get('ticker', ''),
-                'company_name': trade_data.get('asset_description', ''),
-                'transaction_type': trade_data.get('type', ''),
-                'transaction_date': datetime.fromisoformat(trade_data.get('transaction_date', '').replace('Z', '+00:00')),
-                'amount_min': self._parse_amount(trade_data.get('amount_min', '')),
-                'amount_max': self._parse_amount(trade_data.get('amount_max', '')),
-                'description': trade_data.get('description', ''),
-                'source': 'Senate Stock Watcher',
-                'filing_date': datetime.fromisoformat(trade_data.get('filing_date', '').replace('Z', '+00:00')) if trade_data.get('filing_date') else None
             }
-            
-            trade = Trade(**trade_data_dict)
-            self.db.add(trade)
-            
-        except Exception as e:
-            logger.error(f"Error saving Senate trade: {e}")
+        
+        # Find or create member
+        name_key = normalize_member_name(senator_name)
+        member_id = self._senate_member_ids.get(name_key)
+        
+        if member_id is None:
+            # Create new Senate member
+            member_data = MemberCreate(
+                name=senator_name,
+                chamber="Senate",
+                state=trade_data.get('state', ''),
+                party=trade_data.get('party', '')
+            )
+            member_id = self.db.execute(
+                insert(Member).returning(Member.id),
+                member_data.model_dump()
+            ).scalar_one()
+            self._senate_member_ids[name_key] = member_id
+        
+        return member_id
+    
+    def _build_senate_trade_dict(self, trade_data: Dict, member_id: int) -> Dict:
+        """
+        Build a Trade row mapping from a Senate trade record
+        """
+        filing_date = trade_data.get('filing_date')
+        return {
+            'member_id': member_id,
+            'ticker': trade_data.get('ticker', ''),
+            'company_name': trade_data.get('asset_description', ''),
+            'transaction_type': trade_data.get('type', ''),
+            'transaction_date': parse_datetime(trade_data.get('transaction_date', '')),
+            'amount_min': self._parse_amount(trade_data.get('amount_min', '')),
+            'amount_max': self._parse_amount(trade_data.get('amount_max', '')),
+            'description': trade_data.get('description', ''),
+            'source': 'Senate Stock Watcher',
+            'filing_date': parse_datetime(filing_date) if filing_date else None
+        }
     
-    def _parse_amount(self, amount_str: str) -> Optional[float]:
+    def _parse_amount(self, amount_str: str) -> Optional[int]:
         """
-        Parse amount string to float
+        Parse amount string to whole dollars
         """
         if not amount_str:
             return None
         try:
-            # Remove common prefixes and convert to float
-            amount_str = amount_str.replace('$', '').replace(',', '')
-            return float(amount_str)
-        except:
+            # Remove common prefixes and round to whole dollars
+            return round(float(amount_str.translate(AMOUNT_STRIP_TABLE)))
+        except (AttributeError, ValueError):
             return None
     
     async def collect_house_trading_data(self):
@@ -211,79 +405,77 @@ class CongressDataCollector:
                 "QCOM": "QUALCOMM Incorporated", "AVGO": "Broadcom Inc."
             }
             
-            # Generate realistic trades for the last 12 months
-            from datetime import datetime, timedelta
-            import random
+            # Generate realistic trades for the last 12 months, drawing every field as a vector
+            import numpy as np
             
-            for i in range(100):  # Add 100 realistic trades
-                member = random.choice(members)
-                ticker = random.choice(realistic_tickers)
-                transaction_type = random.choice(["Buy", "Sell", "Exchange"])
-                
-                # Generate realistic date (last 12 months)
-                days_ago = random.randint(1, 365)
-                transaction_date = datetime.utcnow() - timedelta(days=days_ago)
-                
-                # Generate realistic amounts (Congress members often trade in larger amounts)
-                amount_min = random.randint(1000, 100000)
-                
-                # For Exchange transactions, add exchange-specific data
-                exchange_from_ticker = None
-                exchange_from_company = None
-                exchange_from_amount = None
-                exchange_ratio = None
-                exchange_reason = None
-                
-                if transaction_type == "Exchange":
-                    # Select a different ticker to exchange FROM
-                    exchange_from_ticker = random.choice([t for t in realistic_tickers if t != ticker])
-                    exchange_from_company = f"{exchange_from_ticker} Company"  # Simplified
-                    exchange_from_amount = random.randint(1000, 100000)
-                    exchange_ratio = round(amount_min / exchange_from_amount, 4)
-                    exchange_reason = random.choice([
-                        "Portfolio rebalancing",
-                        "Sector rotation",
-                        "Risk management",
-                        "Tax optimization",
-                        "Market outlook change"
-                    ])
-                amount_max = amount_min + random.randint(0, 50000)
-                
-                # Check if trade already exists
-                existing_trade = self.db.query(Trade).filter(
-                    Trade.member_id == member.id,
-                    Trade.ticker == ticker,
-                    Trade.transaction_date == transaction_date
-                ).first()
+            num_trades = 100  # Add 100 realistic trades
+            rng = np.random.default_rng()
+            now = np.datetime64(datetime.utcnow())
+            member_ids = [member_id for (member_id,) in self.db.query(Member.id)]
+            
+            members = rng.choice(member_ids, size=num_trades).tolist()
+            ticker_indexes = rng.integers(0, len(realistic_tickers), size=num_trades)
+            tickers = np.asarray(realistic_tickers)[ticker_indexes].tolist()
+            transaction_types = rng.choice(["Buy", "Sell", "Exchange"], size=num_trades).tolist()
+            
+            # Generate realistic dates (last 12 months) as datetime64 vectors
+            transaction_dates = now - rng.integers(1, 366, size=num_trades).astype('timedelta64[D]')
+            filing_dates = (transaction_dates + rng.integers(1, 46, size=num_trades).astype('timedelta64[D]')).tolist()
+            transaction_dates = transaction_dates.tolist()
+            
+            # Generate realistic amounts (Congress members often trade in larger amounts)
+            amount_mins = rng.integers(1000, 100001, size=num_trades)
+            amount_maxs = (amount_mins + rng.integers(0, 50001, size=num_trades)).tolist()
+            amount_mins = amount_mins.tolist()
+            
+            # Exchange-specific values, used only for Exchange rows; a non-zero index
+            # offset guarantees the FROM ticker differs from the traded ticker
+            exchange_from_tickers = np.asarray(realistic_tickers)[
+                (ticker_indexes + rng.integers(1, len(realistic_tickers), size=num_trades)) % len(realistic_tickers)
+            ].tolist()
+            exchange_from_amounts = rng.integers(1000, 100001, size=num_trades).tolist()
+            exchange_reasons = rng.choice([
+                "Portfolio rebalancing",
+                "Sector rotation",
+                "Risk management",
+                "Tax optimization",
+                "Market outlook change"
+            ], size=num_trades).tolist()
+            
+            rows = []
+            for i in range(num_trades):
+                ticker = tickers[i]
+                transaction_type = transaction_types[i]
+                transaction_date = transaction_dates[i]
+                is_exchange = transaction_type == "Exchange"
+                exchange_from_ticker = exchange_from_tickers[i] if is_exchange else None
                 
-                if not existing_trade:
-                    trade = Trade(
-                        member_id=member.id,
-                        ticker=ticker,
-                        company_name=companies.get(ticker, f"{ticker} Corporation"),
-                        transaction_type=transaction_type,
-                        transaction_date=transaction_date,
-                        amount_min=amount_min,
-                        amount_max=amount_max,
-                        # Exchange-specific fields
-                        exchange_from_ticker=exchange_from_ticker,
-                        exchange_from_company=exchange_from_company,
-                        exchange_from_amount=exchange_from_amount,
-                        exchange_ratio=exchange_ratio,
-                        exchange_reason=exchange_reason,
-                        description=f"Periodic Transaction Report - {transaction_type} {ticker}" + 
-                                  (f" FROM {exchange_from_ticker}" if exchange_from_ticker else ""),
-                        source="Real Data Collection",
-                        filing_date=transaction_date + timedelta(days=random.randint(1, 45))
-                    )
-                    self.db.add(trade)
-            
-            self.db.commit()
+                rows.append({
+                    "member_id": members[i],
+                    "ticker": ticker,
+                    "company_name": companies.get(ticker, f"{ticker} Corporation"),
+                    "transaction_type": transaction_type,
+                    "transaction_date": transaction_date,
+                    "amount_min": amount_mins[i],
+                    "amount_max": amount_maxs[i],
+                    # Exchange-specific fields
+                    "exchange_from_ticker": exchange_from_ticker,
+                    "exchange_from_company": f"{exchange_from_ticker} Company" if is_exchange else None,  # Simplified
+                    "exchange_from_amount": exchange_from_amounts[i] if is_exchange else None,
+                    "exchange_ratio": round(amount_mins[i] / exchange_from_amounts[i], 4) if is_exchange else None,
+                    "exchange_reason": exchange_reasons[i] if is_exchange else None,
+                    "description": f"Periodic Transaction Report - {transaction_type} {ticker}" +
+                                   (f" FROM {exchange_from_ticker}" if exchange_from_ticker else ""),
+                    "source": "Real Data Collection",
+                    "filing_date": filing_dates[i]
+                })
+            
+            # Existing trades are skipped by the uq_trade_dedup constraint
+            self.db.execute(insert_ignore_conflicts(Trade, TRADE_DEDUP_COLUMNS), rows)
             logger.info("Added realistic trading data successfully")
             
         except Exception as e:
             logger.error(f"Error adding realistic trading data: {e}")
-            self.db.rollback()
 
     async def collect_propublica_data(self, api_key: str):
         """
@@ -307,48 +499,61 @@ class CongressDataCollector:
         """
         chambers = ['house', 'senate']
         
-        for chamber in chambers:
-            url = f"https://api.propublica.org/congress/v1/118/{chamber}/members.json"
-            headers = {'X-API-Key': api_key}
+        # Both chambers are fetched concurrently
+        await asyncio.gather(*[
+            self._fetch_chamber_members(chamber, api_key)
+            for chamber in chambers
+        ])
+    
+    async def _fetch_chamber_members(self, chamber: str, api_key: str):
+        """
+        Fetch and save ProPublica members for one chamber
+        """
+        url = f"https://api.propublica.org/congress/v1/118/{chamber}/members.json"
+        headers = {'X-API-Key': api_key}
+        
+        response = await self._get_with_retry(url, headers=headers)
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
             
-            response = self.session.get(url, headers=headers)
-            if response.status_code == 200:
-                data = response.json()
-                
-                for member_data in data['results'][0]['members']:
-                    await self._save_propublica_member(member_data, chamber)
+            existing_members = self._get_existing_member_keys()
+            new_members = []
+            for member_data in data['results'][0]['members']:
+                member_dict = self._build_propublica_member_dict(member_data, chamber)
+                member_key = (normalize_member_name(member_dict['name']), member_dict['chamber'])
+                if member_key not in existing_members:
+                    existing_members.add(member_key)
+                    new_members.append(member_dict)
+            
+            # Single batched INSERT for the whole chamber
+            if new_members:
+                self.db.execute(insert(Member), new_members)
     
-    async def _save_propublica_member(self, member_data: Dict, chamber: str):
+    def _get_existing_member_keys(self) -> Set[Tuple[str, str]]:
         """
-        Save ProPublica member data
+        (normalized name, chamber) for every stored member, loaded once per collector
         """
-        try:
-            # Check if member already exists
-            existing_member = self.db.query(Member).filter(
-                and_(
-                    Member.name.ilike(f"%{member_data.get('first_name')}%{member_data.get('last_name')}%"),
-                    Member.chamber == chamber.title()
-                )
-            ).first()
-            
-            if not existing_member:
-                member_dict = {
-                    'name': f"{member_data.get('first_name')} {member_data.get('last_name')}",
-                    'chamber': chamber.title(),
-                    'state': member_data.get('state', ''),
-                    'party': member_data.get('party', ''),
-                    'district': member_data.get('district') if chamber == 'house' else None,
-                    'office': member_data.get('office', ''),
-                    'phone': member_data.get('phone', ''),
-                    'website': member_data.get('url', ''),
-                }
-                
-                member = Member(**member_dict)
-                self.db.add(member)
-                self.db.flush()
-                
-        except Exception as e:
-            logger.error(f"Error saving ProPublica member: {e}")
+        if self._existing_member_keys is None:
+            self._existing_member_keys = {
+                (normalize_member_name(name), chamber)
+                for name, chamber in self.db.query(Member.name, Member.chamber)
+            }
+        return self._existing_member_keys
+    
+    def _build_propublica_member_dict(self, member_data: Dict, chamber: str) -> Dict:
+        """
+        Build a Member row mapping from ProPublica member data
+        """
+        return {
+            'name': f"{member_data.get('first_name')} {member_data.get('last_name')}",
+            'chamber': chamber.title(),
+            'state': member_data.get('state', ''),
+            'party': member_data.get('party', ''),
+            'district': member_data.get('district') if chamber == 'house' else None,
+            'office': member_data.get('office', ''),
+            'phone': member_data.get('phone', ''),
+            'website': member_data.get('url', ''),
+        }
     
     async def _collect_propublica_committees(self, api_key: str):
         """
@@ -356,41 +561,56 @@ class CongressDataCollector:
         """
         chambers = ['house', 'senate']
         
-        for chamber in chambers:
-            url = f"https://api.propublica.org/congress/v1/118/{chamber}/committees.json"
-            headers = {'X-API-Key': api_key}
+        # Both chambers are fetched concurrently
+        await asyncio.gather(*[
+            self._fetch_chamber_committees(chamber, api_key)
+            for chamber in chambers
+        ])
+    
+    async def _fetch_chamber_committees(self, chamber: str, api_key: str):
+        """
+        Fetch and save ProPublica committees for one chamber
+        """
+        url = f"https://api.propublica.org/congress/v1/118/{chamber}/committees.json"
+        headers = {'X-API-Key': api_key}
+        
+        response = await self._get_with_retry(url, headers=headers)
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
             
-            response = self.session.get(url, headers=headers)
-            if response.status_code == 200:
-                data = response.json()
-                
-                for committee_data in data['results'][0]['committees']:
-                    await self._save_propublica_committee(committee_data, chamber)
+            existing_codes = self._get_existing_committee_codes()
+            new_committees = []
+            for committee_data in data['results'][0]['committees']:
+                committee_dict = self._build_propublica_committee_dict(committee_data, chamber)
+                if committee_dict['code'] not in existing_codes:
+                    existing_codes.add(committee_dict['code'])
+                    new_committees.append(committee_dict)
+            
+            # Single batched INSERT for the whole chamber
+            if new_committees:
+                self.db.execute(insert(Committee), new_committees)
     
-    async def _save_propublica_committee(self, committee_data: Dict, chamber: str):
+    def _get_existing_committee_codes(self) -> Set[str]:
         """
-        Save ProPublica committee data
+        Codes of every stored committee, loaded once per collector
         """
-        try:
-            # Check if committee already exists
-            existing_committee = self.db.query(Committee).filter(
-                Committee.code == committee_data.get('id', '')
-            ).first()
-            
-            if not existing_committee:
-                committee_dict = {
-                    'name': committee_data.get('name', ''),
-                    'code': committee_data.get('id', ''),
-                    'chamber': chamber.title(),
-                    'subcommittee': committee_data.get('subcommittee', False),
-                    'description': committee_data.get('purpose', ''),
-                }
-                
-                committee = Committee(**committee_dict)
-                self.db.add(committee)
-                
-        except Exception as e:
-            logger.error(f"Error saving ProPublica committee: {e}")
+        if self._existing_committee_codes is None:
+            self._existing_committee_codes = {
+                code for (code,) in self.db.query(Committee.code)
+            }
+        return self._existing_committee_codes
+    
+    def _build_propublica_committee_dict(self, committee_data: Dict, chamber: str) -> Dict:
+        """
+        Build a Committee row mapping from ProPublica committee data
+        """
+        return {
+            'name': committee_data.get('name', ''),
+            'code': committee_data.get('id', ''),
+            'chamber': chamber.title(),
+            'subcommittee': committee_data.get('subcommittee', False),
+            'description': committee_data.get('purpose', ''),
+        }
 
 async def collect_congress_data(db: Session, propublica_api_key: Optional[str] = None):
     """
@@ -398,22 +618,33 @@ async def collect_congress_data(db: Session, propublica_api_key: Optional[str] =
     """
     collector = CongressDataCollector(db)
     
-    # Collect Senate Stock Watcher data (free)
-    await collector.collect_senate_stock_data()
-    
-    # Collect House trading data (free)
-    await collector.collect_house_trading_data()
+    # Everything below runs in the session's single transaction and is committed once at the end
+    if db.get_bind().dialect.name == "postgresql":
+        # Bulk load: don't wait for the WAL flush when this transaction commits
+        db.execute(text("SET LOCAL synchronous_commit = OFF"))
     
-    # Collect ProPublica data (free with API key)
-    if propublica_api_key:
-        await collector.collect_propublica_data(propublica_api_key)
-    
-    # Scrape real disclosure websites
     try:
         from real_data_scraper import scrape_real_data
-        await scrape_real_data(db)
-    except Exception as e:
-        logger.error(f"Error scraping real data: {e}")
+        
+        # Senate Stock Watcher, House sources and disclosure websites are independent
+        # hosts, so fetch them concurrently. Session calls are synchronous and never
+        # yield to the event loop, so the tasks can share the one transaction.
+        sources = ("Senate Stock Watcher", "House trading", "disclosure website scraping")
+        results = await asyncio.gather(
+            collector.collect_senate_stock_data(),
+            collector.collect_house_trading_data(),
+            scrape_real_data(db, collector.session),
+            return_exceptions=True
+        )
+        for source, result in zip(sources, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error during {source}: {result}")
+        
+        # Collect ProPublica data (free with API key) once the Senate members above exist
+        if propublica_api_key:
+            await collector.collect_propublica_data(propublica_api_key)
+    finally:
+        await collector.close()
     
     # Commit all changes
     db.commit()
@@ -1,25 +1,41 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi.responses import ORJSONResponse
+from typing import Optional
 import uvicorn
-from datetime import datetime, timedelta
+import asyncio
+import logging
+import os
+from datetime import datetime
 
-from database import get_db, engine
-from models import Base, Trade, Member, Committee
-from schemas import TradeResponse, MemberResponse, CommitteeResponse
-from data_collector import collect_congress_data
+from alembic import command
+from alembic.config import Config
+
+from database import BulkSession, engine
+from pagination import NEXT_CURSOR_HEADER
+from models import Base
 from routers import trades, members, committees
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="Congressional Trading Dashboard API",
     description="API for tracking Congressional and Senate stock trades",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+@app.on_event("startup")
+def create_tables():
+    """
+    Create database tables when the server starts rather than on import,
+    then apply migrations for tables created by older versions of the models
+    """
+    Base.metadata.create_all(bind=engine)
+    alembic_config = Config(os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini"))
+    alembic_config.attributes["configure_logger"] = False
+    command.upgrade(alembic_config, "head")
+
 # CORS middleware for frontend integration
 app.add_middleware(
     CORSMiddleware,
@@ -27,6 +43,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Include routers
@@ -46,16 +63,36 @@ async def root():
 async def health_check():
     return {"status": "healthy", "timestamp": datetime.utcnow()}
 
-@app.post("/api/collect-data")
-async def trigger_data_collection(db: Session = Depends(get_db)):
+# Manual data collection currently running in the background, if any
+collection_task: Optional[asyncio.Task] = None
+
+async def run_data_collection():
     """
-    Trigger manual data collection from various sources
+    Collect data from all sources on a dedicated session
     """
+    # Imported on first collection: the collectors pull in httpx and lxml, which API-only workers never need
+    from data_collector import collect_congress_data
+    
     try:
-        await collect_congress_data(db)
-        return {"message": "Data collection completed successfully"}
+        with BulkSession() as db:
+            await collect_congress_data(db)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Data collection failed: {str(e)}")
+        logger.error(f"Data collection failed: {e}")
+    finally:
+        # New trades may have been committed; don't serve stale dashboard stats
+        trades.invalidate_stats_cache()
+
+@app.post("/api/collect-data", status_code=202)
+async def trigger_data_collection():
+    """
+    Start manual data collection from various sources in the background
+    """
+    global collection_task
+    if collection_task is not None and not collection_task.done():
+        return {"message": "Data collection already in progress"}
+    
+    collection_task = asyncio.create_task(run_data_collection())
+    return {"message": "Data collection started"}
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -1,13 +1,23 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy import Column, Integer, BigInteger, String, Float, DateTime, Boolean, ForeignKey, Text, Index, UniqueConstraint, DDL, event
 from sqlalchemy.orm import relationship
 from database import Base
 from datetime import datetime
 
+# Trigram indexes below need pg_trgm, so enable it before creating tables on Postgres
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
+# Columns that identify a single disclosed trade; duplicates are skipped on insert
+TRADE_DEDUP_COLUMNS = ("member_id", "ticker", "transaction_date", "transaction_type")
+
 class Member(Base):
     __tablename__ = "members"
     
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(255), nullable=False, index=True)
+    name = Column(String(255), nullable=False)
     chamber = Column(String(10), nullable=False)  # "House" or "Senate"
     state = Column(String(2), nullable=False)
     party = Column(String(50))
@@ -20,6 +30,20 @@ class Member(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        # Per-chamber member loads during ingest (e.g. all Senate members for the name cache)
+        Index("ix_members_chamber_name", "chamber", "name"),
+        # Name-ordered listings and keyset pagination on (name, id)
+        Index("ix_members_name_id", "name", "id"),
+        # Substring name search (ILIKE '%...%', /api/members/search)
+        Index(
+            "ix_members_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
+    
     # Relationships
     trades = relationship("Trade", back_populates="member")
     committee_memberships = relationship("CommitteeMembership", back_populates="member")
@@ -64,23 +88,59 @@ class Trade(Base):
     ticker = Column(String(10), nullable=False, index=True)
     company_name = Column(String(255))
     transaction_type = Column(String(20), nullable=False)  # "Buy", "Sell", "Exchange"
-    transaction_date = Column(DateTime, nullable=False, index=True)
-    amount_min = Column(Float)  # Minimum transaction amount
-    amount_max = Column(Float)  # Maximum transaction amount
-    amount_exact = Column(Float)  # Exact amount if available
+    transaction_date = Column(DateTime, nullable=False)
+    amount_min = Column(BigInteger)  # Minimum transaction amount, whole dollars
+    amount_max = Column(BigInteger)  # Maximum transaction amount, whole dollars
+    amount_exact = Column(BigInteger)  # Exact amount if available, whole dollars
     
     # Exchange-specific fields
     exchange_from_ticker = Column(String(10))  # What was exchanged FROM
     exchange_from_company = Column(String(255))  # Company name of FROM asset
-    exchange_from_amount = Column(Float)  # Amount of FROM asset
+    exchange_from_amount = Column(BigInteger)  # Amount of FROM asset, whole dollars
     exchange_ratio = Column(Float)  # Exchange ratio (TO amount / FROM amount)
     exchange_reason = Column(String(255))  # Reason for exchange
     
     description = Column(Text)
-    source = Column(String(255))  # Source of the data
+    source = Column(String(255), index=True)  # Source of the data
     filing_date = Column(DateTime)  # When the trade was filed
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        UniqueConstraint(*TRADE_DEDUP_COLUMNS, name="uq_trade_dedup"),
+        Index("ix_trades_member_id_transaction_date", "member_id", "transaction_date"),
+        # Date-ordered listings and keyset pagination on (transaction_date, id)
+        Index("ix_trades_transaction_date_id", "transaction_date", "id"),
+        # Substring ticker filter (ILIKE '%...%' on /api/trades)
+        Index(
+            "ix_trades_ticker_trgm",
+            "ticker",
+            postgresql_using="gin",
+            postgresql_ops={"ticker": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        # Per-ticker listings ordered by date (/api/trades/by-ticker)
+        Index("ix_trades_ticker_transaction_date", "ticker", "transaction_date"),
+        # Partial index covering only the sample-data sources removed by clean_sample_data.py;
+        # elsewhere the WHERE clause is ignored and it would duplicate ix_trades_source
+        Index(
+            "ix_trades_source_sample",
+            source,
+            postgresql_where=source.in_([
+                "Sample Data",
+                "Realistic Trading Data",
+                "Senate Sample Data",
+                "House Sample Data"
+            ])
+        ).ddl_if(dialect="postgresql"),
+    )
+    
     # Relationships
     member = relationship("Member", back_populates="trades")
+
+class FetchCache(Base):
+    __tablename__ = "fetch_cache"
+    
+    url = Column(String(500), primary_key=True)
+    etag = Column(String(255))  # ETag validator from the last successful fetch
+    last_modified = Column(String(64))  # Last-Modified header from the last successful fetch
+    fetched_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
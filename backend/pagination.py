@@ -0,0 +1,40 @@
+"""
+Keyset (seek) pagination cursors for list endpoints
+"""
+import base64
+import binascii
+from datetime import datetime
+from typing import Tuple, Union
+
+from fastapi import HTTPException
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(sort_value: Union[str, datetime], row_id: int) -> str:
+    """
+    Encode the sort key of the last row on a page as an opaque cursor
+    """
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    return base64.urlsafe_b64encode(f"{sort_value}|{row_id}".encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Decode a cursor back into (sort value, row id), rejecting malformed input with a 400
+    """
+    try:
+        sort_value, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return sort_value, int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def decode_datetime_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor whose sort value is a datetime
+    """
+    sort_value, row_id = decode_cursor(cursor)
+    try:
+        return datetime.fromisoformat(sort_value), row_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
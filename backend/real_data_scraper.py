@@ -2,24 +2,118 @@
 Real data scraper for Congressional trading data
 Scrapes actual disclosure websites and public data sources
 """
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import httpx
+from functools import lru_cache
+from itertools import islice
+from lxml import etree, html
 import json
 import re
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import logging
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+from database import insert_ignore_conflicts
+from data_collector import TRADE_BATCH_SIZE, get_with_retry, normalize_member_name
+from models import Member, Trade, TRADE_DEDUP_COLUMNS
+
 logger = logging.getLogger(__name__)
 
+# Number of House disclosure pages fetched at once
+DISCLOSURE_FETCH_CONCURRENCY = 5
+
+# Patterns compiled once at import rather than looked up in re's cache per row
+# Ticker in parentheses (group 1) or a bare 1-5 uppercase letter word (group 2)
+TICKER_PATTERN = re.compile(r'\(([A-Z]{1,5})\)|\b([A-Z]{1,5})\b')
+NON_NUMERIC_PATTERN = re.compile(r'[^\d.-]')
+
+# Uppercase words that look like tickers but aren't
+TICKER_STOPWORDS = frozenset({'THE', 'AND', 'OR', 'FOR', 'INC', 'CORP'})
+
+# XPath expressions compiled once and evaluated directly on lxml trees
+DISCLOSURE_LINKS_XPATH = etree.XPath("//a[contains(@href, 'FinancialDisclosure')]/@href")
+
+@lru_cache(maxsize=256)
+def parse_amount_range(amount_str: str) -> tuple:
+    """
+    Parse amount string to min/max whole-dollar values; cached since disclosures reuse a few standard ranges
+    """
+    try:
+        # Remove currency symbols, separators and any other non-numeric characters
+        amount_str = NON_NUMERIC_PATTERN.sub('', amount_str)
+        
+        if '-' in amount_str:
+            parts = amount_str.split('-')
+            min_amount = round(float(parts[0])) if parts[0] else 0
+            max_amount = round(float(parts[1])) if parts[1] else min_amount
+        else:
+            amount = round(float(amount_str)) if amount_str else 0
+            min_amount = amount
+            max_amount = amount
+        
+        return min_amount, max_amount
+        
+    except Exception as e:
+        logger.error("Error parsing amount '%s': %s", amount_str, e)
+        return 0, 0
+
+def _first_with_class(class_name: str) -> etree.XPath:
+    """
+    Compile an XPath for the first element carrying the given CSS class
+    """
+    return etree.XPath(
+        f"(//*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')])[1]"
+    )
+
+# Places a member name can appear on a disclosure page, in order of preference
+MEMBER_NAME_XPATHS = (
+    etree.XPath("(//h1)[1]"),
+    etree.XPath("(//h2)[1]"),
+    _first_with_class('member-name'),
+    _first_with_class('disclosure-title'),
+)
+
 class RealDataScraper:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, session: Optional[httpx.AsyncClient] = None):
         self.db = db
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Congressional Trading Dashboard (Educational Use)'
-        })
+        # Scraped trade rows waiting to be written in one bulk INSERT
+        self._pending_trades: List[Dict] = []
+        # Normalized member name -> member id, loaded on first use
+        self._member_ids: Optional[Dict[str, int]] = None
+        # Reuse the caller's connection pool when given one; it stays open for the caller
+        self._owns_session = session is None
+        self.session = session or httpx.AsyncClient(
+            headers={
+                'User-Agent': 'Congressional Trading Dashboard (Educational Use)'
+            },
+            limits=httpx.Limits(
+                max_connections=DISCLOSURE_FETCH_CONCURRENCY,
+                keepalive_expiry=30
+            ),
+            timeout=30.0,
+            follow_redirects=True
+        )
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def close(self):
+        """
+        Close the pooled HTTP client if this scraper created it
+        """
+        if self._owns_session:
+            await self.session.aclose()
+    
+    async def _get_with_retry(self, url: str) -> httpx.Response:
+        """
+        GET a URL with the collector's shared retry policy
+        """
+        return await get_with_retry(self.session, url)
     
     async def scrape_house_disclosures(self):
         """
@@ -31,79 +125,81 @@ class RealDataScraper:
             # House Clerk's website for financial disclosures
             url = "https://clerk.house.gov/FinancialDisclosure"
             
-            response = self.session.get(url)
+            response = await self._get_with_retry(url)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                tree = html.fromstring(response.content)
                 
                 # Look for disclosure links
-                disclosure_links = soup.find_all('a', href=re.compile(r'FinancialDisclosure'))
+                disclosure_links = DISCLOSURE_LINKS_XPATH(tree)
                 
-                for link in disclosure_links[:10]:  # Limit to first 10 for demo
-                    await self._process_house_disclosure(link.get('href'))
+                # Fetch disclosures concurrently, a bounded number at a time
+                semaphore = asyncio.Semaphore(DISCLOSURE_FETCH_CONCURRENCY)
+                await asyncio.gather(*(
+                    self._process_house_disclosure(href, semaphore)
+                    for href in disclosure_links[:10]  # Limit to first 10 for demo
+                ))
                     
         except Exception as e:
-            logger.error(f"Error scraping House disclosures: {e}")
+            logger.error("Error scraping House disclosures: %s", e)
     
-    async def _process_house_disclosure(self, disclosure_url: str):
+    async def _process_house_disclosure(self, disclosure_url: str, semaphore: asyncio.Semaphore):
         """
         Process individual House disclosure
         """
         try:
             full_url = f"https://clerk.house.gov{disclosure_url}"
-            response = self.session.get(full_url)
+            async with semaphore:
+                response = await self._get_with_retry(full_url)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                tree = html.fromstring(response.content)
                 
                 # Extract member information
-                member_name = self._extract_member_name(soup)
+                member_name = self._extract_member_name(tree)
                 if member_name:
-                    await self._process_member_trades(member_name, soup)
+                    await self._process_member_trades(member_name, tree)
                     
         except Exception as e:
-            logger.error(f"Error processing House disclosure {disclosure_url}: {e}")
+            logger.error("Error processing House disclosure %s: %s", disclosure_url, e)
     
-    def _extract_member_name(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_member_name(self, tree: html.HtmlElement) -> Optional[str]:
         """
         Extract member name from disclosure page
         """
         try:
             # Look for member name in various formats
-            name_selectors = [
-                'h1', 'h2', '.member-name', '.disclosure-title'
-            ]
-            
-            for selector in name_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    name = element.get_text().strip()
+            for name_xpath in MEMBER_NAME_XPATHS:
+                elements = name_xpath(tree)
+                if elements:
+                    name = elements[0].text_content().strip()
                     if name and len(name) > 3:
                         return name
             
             return None
             
         except Exception as e:
-            logger.error(f"Error extracting member name: {e}")
+            logger.error("Error extracting member name: %s", e)
             return None
     
-    async def _process_member_trades(self, member_name: str, soup: BeautifulSoup):
+    async def _process_member_trades(self, member_name: str, tree: html.HtmlElement):
         """
         Process trades for a specific member
         """
         try:
-            # Look for trading information in the disclosure
-            trade_tables = soup.find_all('table')
-            
-            for table in trade_tables:
-                rows = table.find_all('tr')
+            # Look for trading information in the disclosure, walking the tree
+            # lazily instead of building row and cell lists
+            for table in tree.iter('table'):
+                rows = table.iter('tr')
+                next(rows, None)  # Skip header
                 
-                for row in rows[1:]:  # Skip header
-                    cells = row.find_all(['td', 'th'])
+                for row in rows:
+                    # Only the first three cells are read
+                    cells = list(islice(row.iterchildren('td', 'th'), 3))
                     if len(cells) >= 3:
                         await self._extract_trade_from_row(member_name, cells)
                         
         except Exception as e:
-            logger.error(f"Error processing trades for {member_name}: {e}")
+            logger.error("Error processing trades for %s: %s", member_name, e)
     
     async def _extract_trade_from_row(self, member_name: str, cells):
         """
@@ -112,9 +208,9 @@ class RealDataScraper:
         try:
             # This is a simplified extraction - real implementation would be more sophisticated
             if len(cells) >= 3:
-                asset = cells[0].get_text().strip()
-                transaction_type = cells[1].get_text().strip()
-                amount = cells[2].get_text().strip()
+                asset = cells[0].text_content().strip()
+                transaction_type = cells[1].text_content().strip()
+                amount = cells[2].text_content().strip()
                 
                 # Extract ticker from asset name
                 ticker = self._extract_ticker(asset)
@@ -122,101 +218,96 @@ class RealDataScraper:
                     await self._save_trade(member_name, ticker, transaction_type, amount)
                     
         except Exception as e:
-            logger.error(f"Error extracting trade from row: {e}")
+            logger.error("Error extracting trade from row: %s", e)
     
     def _extract_ticker(self, asset_text: str) -> Optional[str]:
         """
         Extract stock ticker from asset text
         """
         try:
-            # Look for common ticker patterns
-            ticker_patterns = [
-                r'\b([A-Z]{1,5})\b',  # 1-5 uppercase letters
-                r'\(([A-Z]{1,5})\)',  # Ticker in parentheses
-            ]
+            # One scan finds both bare and parenthesised tickers, in text order
+            matches = TICKER_PATTERN.finditer(asset_text)
+            match = next(matches, None)
+            if match is None:
+                return None
             
-            for pattern in ticker_patterns:
-                match = re.search(pattern, asset_text)
-                if match:
-                    ticker = match.group(1)
-                    # Filter out common false positives
-                    if ticker not in ['THE', 'AND', 'OR', 'FOR', 'INC', 'CORP']:
-                        return ticker
+            # Prefer the first uppercase word unless it's a common false positive
+            ticker = match.group(1) or match.group(2)
+            if ticker not in TICKER_STOPWORDS:
+                return ticker
+            
+            # Otherwise fall back to the first ticker in parentheses
+            if match.group(1) is None:
+                match = next((m for m in matches if m.group(1)), None)
+            if match is not None and match.group(1) not in TICKER_STOPWORDS:
+                return match.group(1)
             
             return None
             
         except Exception as e:
-            logger.error(f"Error extracting ticker from '{asset_text}': {e}")
+            logger.error("Error extracting ticker from '%s': %s", asset_text, e)
             return None
     
     async def _save_trade(self, member_name: str, ticker: str, transaction_type: str, amount: str):
         """
-        Save trade to database
+        Queue a trade for the next bulk insert
         """
         try:
-            from models import Member, Trade
+            # Load every member once instead of querying per trade
+            if self._member_ids is None:
+                self._member_ids = {
+                    normalize_member_name(name): member_id
+                    for member_id, name in self.db.query(Member.id, Member.name)
+                }
             
             # Find or create member
-            member = self.db.query(Member).filter(
-                Member.name.ilike(f"%{member_name}%")
-            ).first()
+            name_key = normalize_member_name(member_name)
+            member_id = self._member_ids.get(name_key)
             
-            if not member:
+            if member_id is None:
                 # Create new member
-                member = Member(
-                    name=member_name,
-                    chamber="House",
-                    state="Unknown",
-                    party="Unknown"
-                )
-                self.db.add(member)
-                self.db.flush()
+                member_id = self.db.execute(
+                    insert(Member).returning(Member.id),
+                    {
+                        'name': member_name,
+                        'chamber': "House",
+                        'state': "Unknown",
+                        'party': "Unknown"
+                    }
+                ).scalar_one()
+                self._member_ids[name_key] = member_id
             
             # Parse amount
-            amount_min, amount_max = self._parse_amount(amount)
+            amount_min, amount_max = parse_amount_range(amount)
             
             # Create trade
-            trade = Trade(
-                member_id=member.id,
-                ticker=ticker,
-                company_name=f"{ticker} Corporation",
-                transaction_type=transaction_type,
-                transaction_date=datetime.utcnow() - timedelta(days=30),  # Default to 30 days ago
-                amount_min=amount_min,
-                amount_max=amount_max,
-                description=f"Scraped from House disclosure",
-                source="House Clerk Website"
-            )
+            self._pending_trades.append({
+                'member_id': member_id,
+                'ticker': ticker,
+                'company_name': f"{ticker} Corporation",
+                'transaction_type': transaction_type,
+                'transaction_date': datetime.utcnow() - timedelta(days=30),  # Default to 30 days ago
+                'amount_min': amount_min,
+                'amount_max': amount_max,
+                'description': f"Scraped from House disclosure",
+                'source': "House Clerk Website"
+            })
+            logger.info("Added trade: %s - %s %s", member_name, ticker, transaction_type)
             
-            self.db.add(trade)
-            logger.info(f"Added trade: {member_name} - {ticker} {transaction_type}")
+            # Keep the queue bounded on large scrapes
+            if len(self._pending_trades) >= TRADE_BATCH_SIZE:
+                self.flush_trades()
             
         except Exception as e:
-            logger.error(f"Error saving trade: {e}")
+            logger.error("Error saving trade: %s", e)
     
-    def _parse_amount(self, amount_str: str) -> tuple:
+    def flush_trades(self):
         """
-        Parse amount string to min/max values
+        Write all queued trades in a single bulk INSERT, skipping duplicates
         """
-        try:
-            # Remove common prefixes and suffixes
-            amount_str = re.sub(r'[$,]', '', amount_str)
-            amount_str = re.sub(r'[^\d.-]', '', amount_str)
-            
-            if '-' in amount_str:
-                parts = amount_str.split('-')
-                min_amount = float(parts[0]) if parts[0] else 0
-                max_amount = float(parts[1]) if parts[1] else min_amount
-            else:
-                amount = float(amount_str) if amount_str else 0
-                min_amount = amount
-                max_amount = amount
-            
-            return min_amount, max_amount
-            
-        except Exception as e:
-            logger.error(f"Error parsing amount '{amount_str}': {e}")
-            return 0, 0
+        if self._pending_trades:
+            self.db.execute(insert_ignore_conflicts(Trade, TRADE_DEDUP_COLUMNS), self._pending_trades)
+            self._pending_trades = []
     
     async def scrape_senate_disclosures(self):
         """
@@ -228,14 +319,14 @@ class RealDataScraper:
             # Senate financial disclosure website
             url = "https://efdsearch.senate.gov/search/"
             
-            response = self.session.get(url)
+            response = await self._get_with_retry(url)
             if response.status_code == 200:
                 # This would require more sophisticated parsing
                 # TODO: Implement real Senate data scraping
                 logger.info("Real Senate data scraping not yet implemented")
                 
         except Exception as e:
-            logger.error(f"Error scraping Senate disclosures: {e}")
+            logger.error("Error scraping Senate disclosures: %s", e)
     
     async def _add_senate_sample_data(self):
         """
@@ -259,39 +350,37 @@ class RealDataScraper:
                 ticker = senate_tickers[i % len(senate_tickers)]
                 transaction_type = ["Buy", "Sell"][i % 2]
                 
-                trade = Trade(
-                    member_id=member.id,
-                    ticker=ticker,
-                    company_name=f"{ticker} Corporation",
-                    transaction_type=transaction_type,
-                    transaction_date=datetime.utcnow() - timedelta(days=i * 10),
-                    amount_min=5000 + (i * 1000),
-                    amount_max=10000 + (i * 2000),
-                    description=f"Senate disclosure - {transaction_type} {ticker}",
-                    source="Senate Financial Disclosures"
-                )
-                
-                self.db.add(trade)
+                self._pending_trades.append({
+                    'member_id': member.id,
+                    'ticker': ticker,
+                    'company_name': f"{ticker} Corporation",
+                    'transaction_type': transaction_type,
+                    'transaction_date': datetime.utcnow() - timedelta(days=i * 10),
+                    'amount_min': 5000 + (i * 1000),
+                    'amount_max': 10000 + (i * 2000),
+                    'description': f"Senate disclosure - {transaction_type} {ticker}",
+                    'source': "Senate Financial Disclosures"
+                })
             
-            self.db.commit()
+            self.flush_trades()
             logger.info("Added Senate sample data")
             
         except Exception as e:
-            logger.error(f"Error adding Senate sample data: {e}")
-            self.db.rollback()
+            logger.error("Error adding Senate sample data: %s", e)
 
-async def scrape_real_data(db: Session):
+async def scrape_real_data(db: Session, session: Optional[httpx.AsyncClient] = None):
     """
     Main function to scrape real Congressional data
     """
-    scraper = RealDataScraper(db)
-    
-    # Scrape House disclosures
-    await scraper.scrape_house_disclosures()
-    
-    # Scrape Senate disclosures
-    await scraper.scrape_senate_disclosures()
+    async with RealDataScraper(db, session) as scraper:
+        # Scrape House disclosures
+        await scraper.scrape_house_disclosures()
+        
+        # Scrape Senate disclosures
+        await scraper.scrape_senate_disclosures()
+        
+        # Write everything scraped above in one batch
+        scraper.flush_trades()
     
-    # Commit all changes
-    db.commit()
+    # Changes are committed by the caller together with the rest of the ingest
     logger.info("Real data scraping completed")
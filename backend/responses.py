@@ -0,0 +1,37 @@
+"""
+Pre-serialized JSON responses for list endpoints
+"""
+from typing import Any, Iterable, List, Type
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import null
+
+def json_response(adapter: TypeAdapter, value: Any) -> Response:
+    """
+    Serialize a value with a prebuilt TypeAdapter in a single pydantic-core call,
+    bypassing FastAPI's per-request response_model validation
+    """
+    return Response(content=adapter.dump_json(value), media_type="application/json")
+
+def response_columns(schema: Type[BaseModel], model: Any, **columns: Any) -> List:
+    """
+    Columns selecting exactly the fields of a flat response schema, in field order: keyword
+    arguments supply computed fields, table columns fill the rest, and any other field is NULL
+    """
+    table_columns = model.__table__.c
+    selected = []
+    for name in schema.model_fields:
+        column = columns.get(name)
+        if column is None:
+            column = table_columns[name] if name in table_columns else null()
+        selected.append(column.label(name))
+    return selected
+
+def rows_response(rows: Iterable) -> ORJSONResponse:
+    """
+    Serialize result rows already shaped by response_columns straight to JSON with orjson,
+    skipping ORM object and response model construction entirely
+    """
+    return ORJSONResponse([dict(row._mapping) for row in rows])
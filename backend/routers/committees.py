@@ -4,12 +4,26 @@ from typing import List, Optional
 
 from database import get_db
 from models import Committee, CommitteeMembership, Member
-from schemas import CommitteeResponse, CommitteeMembershipResponse, MemberResponse
+from responses import json_response
+from schemas import (
+    CommitteeResponse, CommitteeMembershipResponse, MemberResponse,
+    COMMITTEE_LIST_ADAPTER, COMMITTEE_MEMBERSHIP_LIST_ADAPTER, MEMBER_LIST_ADAPTER
+)
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Lowercased chamber path values -> stored chamber names
+COMMITTEE_CHAMBERS = {'house': 'House', 'senate': 'Senate', 'joint': 'Joint'}
+
+def require_committee(db: Session, committee_id: int):
+    """
+    Raise a 404 unless a committee with the given ID exists
+    """
+    if db.query(Committee.id).filter(Committee.id == committee_id).scalar() is None:
+        raise HTTPException(status_code=404, detail="Committee not found")
+
 @router.get("/", response_model=List[CommitteeResponse])
 async def get_committees(
     skip: int = Query(0, ge=0),
@@ -32,7 +46,7 @@ async def get_committees(
     # Order by name
     committees = query.order_by(Committee.name).offset(skip).limit(limit).all()
     
-    return committees
+    return json_response(COMMITTEE_LIST_ADAPTER, [CommitteeResponse.from_orm_trusted(committee) for committee in committees])
 
 @router.get("/by-chamber/{chamber}", response_model=List[CommitteeResponse])
 async def get_committees_by_chamber(
@@ -44,14 +58,15 @@ async def get_committees_by_chamber(
     """
     Get committees by chamber
     """
-    if chamber.lower() not in ['house', 'senate', 'joint']:
+    chamber_name = COMMITTEE_CHAMBERS.get(chamber.lower())
+    if chamber_name is None:
         raise HTTPException(status_code=400, detail="Chamber must be 'House', 'Senate', or 'Joint'")
     
     committees = db.query(Committee).filter(
-        Committee.chamber == chamber.title()
+        Committee.chamber == chamber_name
     ).order_by(Committee.name).offset(skip).limit(limit).all()
     
-    return committees
+    return json_response(COMMITTEE_LIST_ADAPTER, [CommitteeResponse.from_orm_trusted(committee) for committee in committees])
 
 @router.get("/main", response_model=List[CommitteeResponse])
 async def get_main_committees(
@@ -70,7 +85,7 @@ async def get_main_committees(
     
     committees = query.order_by(Committee.name).offset(skip).limit(limit).all()
     
-    return committees
+    return json_response(COMMITTEE_LIST_ADAPTER, [CommitteeResponse.from_orm_trusted(committee) for committee in committees])
 
 @router.get("/subcommittees", response_model=List[CommitteeResponse])
 async def get_subcommittees(
@@ -89,7 +104,7 @@ async def get_subcommittees(
     
     committees = query.order_by(Committee.name).offset(skip).limit(limit).all()
     
-    return committees
+    return json_response(COMMITTEE_LIST_ADAPTER, [CommitteeResponse.from_orm_trusted(committee) for committee in committees])
 
 @router.get("/{committee_id}", response_model=CommitteeResponse)
 async def get_committee(committee_id: int, db: Session = Depends(get_db)):
@@ -113,16 +128,15 @@ async def get_committee_members(
     """
     Get members of a specific committee
     """
-    # Verify committee exists
-    committee = db.query(Committee).filter(Committee.id == committee_id).first()
-    if not committee:
-        raise HTTPException(status_code=404, detail="Committee not found")
-    
     members = db.query(Member).join(CommitteeMembership).filter(
         CommitteeMembership.committee_id == committee_id
     ).order_by(Member.name).offset(skip).limit(limit).all()
     
-    return members
+    # Only an empty page needs a second look to tell a missing committee apart
+    if not members:
+        require_committee(db, committee_id)
+    
+    return json_response(MEMBER_LIST_ADAPTER, [MemberResponse.from_orm_trusted(member) for member in members])
 
 @router.get("/{committee_id}/memberships", response_model=List[CommitteeMembershipResponse])
 async def get_committee_memberships(
@@ -134,16 +148,18 @@ async def get_committee_memberships(
     """
     Get committee memberships for a specific committee
     """
-    # Verify committee exists
-    committee = db.query(Committee).filter(Committee.id == committee_id).first()
-    if not committee:
-        raise HTTPException(status_code=404, detail="Committee not found")
-    
     memberships = db.query(CommitteeMembership).filter(
         CommitteeMembership.committee_id == committee_id
     ).order_by(CommitteeMembership.start_date.desc()).offset(skip).limit(limit).all()
     
-    return memberships
+    # Only an empty page needs a second look to tell a missing committee apart
+    if not memberships:
+        require_committee(db, committee_id)
+    
+    return json_response(
+        COMMITTEE_MEMBERSHIP_LIST_ADAPTER,
+        [CommitteeMembershipResponse.from_orm_trusted(membership) for membership in memberships]
+    )
 
 @router.get("/member/{member_id}/committees", response_model=List[CommitteeResponse])
 async def get_member_committees(
@@ -155,13 +171,12 @@ async def get_member_committees(
     """
     Get committees for a specific member
     """
-    # Verify member exists
-    member = db.query(Member).filter(Member.id == member_id).first()
-    if not member:
-        raise HTTPException(status_code=404, detail="Member not found")
-    
     committees = db.query(Committee).join(CommitteeMembership).filter(
         CommitteeMembership.member_id == member_id
     ).order_by(Committee.name).offset(skip).limit(limit).all()
     
-    return committees
+    # Only an empty page needs a second look to tell a missing member apart
+    if not committees and db.query(Member.id).filter(Member.id == member_id).scalar() is None:
+        raise HTTPException(status_code=404, detail="Member not found")
+    
+    return json_response(COMMITTEE_LIST_ADAPTER, [CommitteeResponse.from_orm_trusted(committee) for committee in committees])
@@ -1,19 +1,25 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import exists, func, tuple_
 from typing import List, Optional
 
 from database import get_db
+from pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
 from models import Member, Trade
+from responses import response_columns, rows_response
 from schemas import MemberResponse
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Lowercased chamber path values -> stored chamber names
+MEMBER_CHAMBERS = {'house': 'House', 'senate': 'Senate'}
+
 @router.get("/", response_model=List[MemberResponse])
 async def get_members(
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0, deprecated=True),
     limit: int = Query(100, ge=1, le=1000),
     chamber: Optional[str] = None,
     party: Optional[str] = None,
@@ -23,8 +29,11 @@ async def get_members(
 ):
     """
     Get members with optional filtering
+    
+    Pages are fetched by keyset: pass the X-Next-Cursor header of one response as
+    `cursor` to get the next page. `skip` is only honored when no cursor is given.
     """
-    query = db.query(Member)
+    query = db.query(*response_columns(MemberResponse, Member))
     
     # Apply filters
     if chamber:
@@ -34,15 +43,29 @@ async def get_members(
     if state:
         query = query.filter(Member.state == state)
     if has_trades is not None:
+        member_has_trades = exists().where(Trade.member_id == Member.id)
         if has_trades:
-            query = query.filter(Member.trades.any())
+            query = query.filter(member_has_trades)
         else:
-            query = query.filter(~Member.trades.any())
+            query = query.filter(~member_has_trades)
+    
+    # Order by name, id breaking ties for a stable cursor
+    query = query.order_by(Member.name, Member.id)
     
-    # Order by name
-    members = query.order_by(Member.name).offset(skip).limit(limit).all()
+    # Seek past the last row of the previous page instead of scanning skipped rows
+    if cursor:
+        cursor_name, cursor_id = decode_cursor(cursor)
+        query = query.filter(tuple_(Member.name, Member.id) > (cursor_name, cursor_id))
+    elif skip:
+        query = query.offset(skip)
     
-    return members
+    members = query.limit(limit).all()
+    
+    response = rows_response(members)
+    if len(members) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(members[-1].name, members[-1].id)
+    
+    return response
 
 @router.get("/by-chamber/{chamber}", response_model=List[MemberResponse])
 async def get_members_by_chamber(
@@ -54,14 +77,15 @@ async def get_members_by_chamber(
     """
     Get members by chamber (House or Senate)
     """
-    if chamber.lower() not in ['house', 'senate']:
+    chamber_name = MEMBER_CHAMBERS.get(chamber.lower())
+    if chamber_name is None:
         raise HTTPException(status_code=400, detail="Chamber must be 'House' or 'Senate'")
     
-    members = db.query(Member).filter(
-        Member.chamber == chamber.title()
+    members = db.query(*response_columns(MemberResponse, Member)).filter(
+        Member.chamber == chamber_name
     ).order_by(Member.name).offset(skip).limit(limit).all()
     
-    return members
+    return rows_response(members)
 
 @router.get("/by-state/{state}", response_model=List[MemberResponse])
 async def get_members_by_state(
@@ -73,11 +97,11 @@ async def get_members_by_state(
     """
     Get members by state
     """
-    members = db.query(Member).filter(
+    members = db.query(*response_columns(MemberResponse, Member)).filter(
         Member.state == state.upper()
     ).order_by(Member.name).offset(skip).limit(limit).all()
     
-    return members
+    return rows_response(members)
 
 @router.get("/by-party/{party}", response_model=List[MemberResponse])
 async def get_members_by_party(
@@ -89,11 +113,11 @@ async def get_members_by_party(
     """
     Get members by political party
     """
-    members = db.query(Member).filter(
+    members = db.query(*response_columns(MemberResponse, Member)).filter(
         Member.party == party
     ).order_by(Member.name).offset(skip).limit(limit).all()
     
-    return members
+    return rows_response(members)
 
 @router.get("/most-active", response_model=List[MemberResponse])
 async def get_most_active_traders(
@@ -103,12 +127,20 @@ async def get_most_active_traders(
     """
     Get members with the most trades
     """
+    # Trade counts aggregated once per member, then joined back to the member rows
+    trade_counts = db.query(
+        Trade.member_id,
+        func.count(Trade.id).label('trade_count')
+    ).group_by(Trade.member_id).subquery()
+    
     # Get members ordered by number of trades
-    members = db.query(Member).join(Trade).group_by(Member.id).order_by(
-        func.count(Trade.id).desc()
-    ).limit(limit).all()
+    members = db.query(
+        *response_columns(MemberResponse, Member, trade_count=trade_counts.c.trade_count)
+    ).join(
+        trade_counts, Member.id == trade_counts.c.member_id
+    ).order_by(trade_counts.c.trade_count.desc()).limit(limit).all()
     
-    return members
+    return rows_response(members)
 
 @router.get("/{member_id}", response_model=MemberResponse)
 async def get_member(member_id: int, db: Session = Depends(get_db)):
@@ -132,8 +164,8 @@ async def search_members(
     """
     Search members by name
     """
-    members = db.query(Member).filter(
+    members = db.query(*response_columns(MemberResponse, Member)).filter(
         Member.name.ilike(f"%{name}%")
     ).order_by(Member.name).offset(skip).limit(limit).all()
     
-    return members
+    return rows_response(members)
@@ -1,99 +1,203 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import func, literal, null, or_, select, tuple_, union_all
+from typing import List, Optional, Tuple
+from collections import defaultdict
 from datetime import datetime, timedelta
+from functools import lru_cache
+import time
 
 from database import get_db
+from pagination import NEXT_CURSOR_HEADER, decode_datetime_cursor, encode_cursor
 from models import Trade, Member, Committee, CommitteeMembership
-from schemas import TradeResponse, TradeWithMember, TradeWithMemberAndCommittees, TradeFilter, DashboardStats
+from responses import json_response, response_columns
+from schemas import (
+    CommitteeResponse, MemberResponse, MemberWithCommittees, TradeResponse, TradeWithMember, TradeWithMemberAndCommittees,
+    ExchangeTradeResponse, AnyTradeResponse, AnyTradeWithMember, AnyTradeWithMemberAndCommittees, build_trade_response,
+    DashboardStats, TRADE_WITH_MEMBER_LIST_ADAPTER,
+    TRADE_WITH_MEMBER_AND_COMMITTEES_LIST_ADAPTER, DASHBOARD_STATS_ADAPTER
+)
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-@router.get("/", response_model=List[TradeWithMemberAndCommittees])
-async def get_trades(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
-    member_id: Optional[int] = None,
-    chamber: Optional[str] = None,
-    party: Optional[str] = None,
-    ticker: Optional[str] = None,
-    transaction_type: Optional[str] = None,
-    start_date: Optional[datetime] = None,
-    end_date: Optional[datetime] = None,
-    min_amount: Optional[float] = None,
-    max_amount: Optional[float] = None,
-    include_committees: bool = Query(True),
-    db: Session = Depends(get_db)
-):
+# Seconds a computed /stats response is served from memory
+STATS_CACHE_TTL = 60
+
+# (monotonic expiry time, serialized JSON body) of the last /stats computation
+_stats_cache: Optional[Tuple[float, bytes]] = None
+
+def invalidate_stats_cache():
     """
-    Get trades with optional filtering and committee information
+    Drop the cached /stats response so the next request recomputes it
     """
-    query = db.query(Trade).join(Member)
-    
-    # Apply filters
+    global _stats_cache
+    _stats_cache = None
+
+# Distinct /trades filter combinations whose SQL criteria are kept for reuse
+TRADE_FILTER_CACHE_SIZE = 1024
+
+@lru_cache(maxsize=TRADE_FILTER_CACHE_SIZE)
+def trade_filter_criteria(
+    member_id: Optional[int],
+    chamber: Optional[str],
+    party: Optional[str],
+    ticker: Optional[str],
+    transaction_type: Optional[str],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    min_amount: Optional[float],
+    max_amount: Optional[float]
+) -> tuple:
+    """
+    WHERE criteria for a set of /trades filters; cached since dashboards poll with identical filters.
+    Chamber and party criteria need trades joined to members.
+    """
+    criteria = []
     if member_id:
-        query = query.filter(Trade.member_id == member_id)
+        criteria.append(Trade.member_id == member_id)
     if chamber:
-        query = query.filter(Member.chamber == chamber)
+        criteria.append(Member.chamber == chamber)
     if party:
-        query = query.filter(Member.party == party)
+        criteria.append(Member.party == party)
     if ticker:
-        query = query.filter(Trade.ticker.ilike(f"%{ticker}%"))
+        criteria.append(Trade.ticker.ilike(f"%{ticker}%"))
     if transaction_type:
-        query = query.filter(Trade.transaction_type == transaction_type)
+        criteria.append(Trade.transaction_type == transaction_type)
     if start_date:
-        query = query.filter(Trade.transaction_date >= start_date)
+        criteria.append(Trade.transaction_date >= start_date)
     if end_date:
-        query = query.filter(Trade.transaction_date <= end_date)
+        criteria.append(Trade.transaction_date <= end_date)
     if min_amount:
-        query = query.filter(
+        criteria.append(
             or_(
                 Trade.amount_exact >= min_amount,
                 Trade.amount_min >= min_amount
             )
         )
     if max_amount:
-        query = query.filter(
+        criteria.append(
             or_(
                 Trade.amount_exact <= max_amount,
                 Trade.amount_max <= max_amount
             )
         )
     
-    # Order by transaction date (most recent first)
-    trades = query.order_by(Trade.transaction_date.desc()).offset(skip).limit(limit).all()
+    return tuple(criteria)
+
+# Columns of a trade response; the exchange fields come last so non-Exchange rows can drop them
+TRADE_RESPONSE_COLUMNS = response_columns(ExchangeTradeResponse, Trade)
+TRADE_RESPONSE_KEYS = tuple(column.name for column in TRADE_RESPONSE_COLUMNS)
+COMPACT_TRADE_RESPONSE_KEYS = TRADE_RESPONSE_KEYS[:len(TradeResponse.model_fields)]
+
+def trade_row_dicts(rows) -> List[dict]:
+    """
+    Plain dicts shaped like build_trade_response output from rows selecting TRADE_RESPONSE_COLUMNS,
+    without building ORM objects or response models
+    """
+    return [
+        dict(zip(TRADE_RESPONSE_KEYS if row.transaction_type == "Exchange" else COMPACT_TRADE_RESPONSE_KEYS, row))
+        for row in rows
+    ]
+
+def with_shared_members(model, member_model, trades) -> list:
+    """
+    Build trade responses whose nested member is constructed once per member rather than per trade
+    """
+    members = {}
+    result = []
+    for trade in trades:
+        member = members.get(trade.member_id)
+        if member is None:
+            member = members[trade.member_id] = member_model.from_orm_trusted(trade.member)
+        result.append(build_trade_response(model, trade, member=member))
+    return result
+
+@router.get("/", response_model=List[AnyTradeWithMemberAndCommittees])
+async def get_trades(
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=1000),
+    member_id: Optional[int] = None,
+    chamber: Optional[str] = None,
+    party: Optional[str] = None,
+    ticker: Optional[str] = None,
+    transaction_type: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    min_amount: Optional[float] = None,
+    max_amount: Optional[float] = None,
+    include_committees: bool = Query(True),
+    db: Session = Depends(get_db)
+):
+    """
+    Get trades with optional filtering and committee information
+    
+    Pages are fetched by keyset: pass the X-Next-Cursor header of one response as
+    `cursor` to get the next page. `skip` is only honored when no cursor is given.
+    """
+    # Members are loaded for the page in one extra IN query rather than per trade
+    query = db.query(Trade).options(selectinload(Trade.member))
+    
+    # Apply filters
+    if chamber or party:
+        query = query.join(Member)
+    query = query.filter(*trade_filter_criteria(
+        member_id, chamber, party, ticker, transaction_type,
+        start_date, end_date, min_amount, max_amount
+    ))
+    
+    # Order by transaction date (most recent first), id breaking ties for a stable cursor
+    query = query.order_by(Trade.transaction_date.desc(), Trade.id.desc())
     
-    # If committees are requested, fetch committee memberships for each member
+    # Seek past the last row of the previous page instead of scanning skipped rows
+    if cursor:
+        cursor_date, cursor_id = decode_datetime_cursor(cursor)
+        query = query.filter(tuple_(Trade.transaction_date, Trade.id) < (cursor_date, cursor_id))
+    elif skip:
+        query = query.offset(skip)
+    
+    trades = query.limit(limit).all()
+    
+    # If committees are requested, fetch committee memberships for the page's members
     if include_committees:
-        result = []
-        for trade in trades:
-            # Get committee memberships for this member
-            committee_memberships = db.query(CommitteeMembership).join(Committee).filter(
-                CommitteeMembership.member_id == trade.member_id,
+        # Current committees of every member on the page in one query
+        committees_by_member = defaultdict(list)
+        member_ids = {trade.member_id for trade in trades}
+        if member_ids:
+            current_committees = db.query(CommitteeMembership.member_id, Committee).join(Committee).filter(
+                CommitteeMembership.member_id.in_(member_ids),
                 CommitteeMembership.end_date.is_(None)  # Only current memberships
-            ).all()
-            
-            # Create member with committees
-            member_data = {
-                **trade.member.__dict__,
-                'committees': [cm.committee.__dict__ for cm in committee_memberships]
-            }
-            
-            # Create trade with member and committees
-            trade_data = {
-                **trade.__dict__,
-                'member': member_data
-            }
-            result.append(trade_data)
+            )
+            for committee_member_id, committee in current_committees:
+                committees_by_member[committee_member_id].append(CommitteeResponse.from_orm_trusted(committee))
+        
+        # Each member with committees is built once and shared by all of their trades
+        members_with_committees = {
+            trade.member_id: MemberWithCommittees.from_orm_trusted(
+                trade.member,
+                committees=committees_by_member[trade.member_id]
+            )
+            for trade in trades
+        }
         
-        return result
+        # Create trades with member and committees
+        result = [
+            build_trade_response(TradeWithMemberAndCommittees, trade, member=members_with_committees[trade.member_id])
+            for trade in trades
+        ]
+    else:
+        result = with_shared_members(TradeWithMemberAndCommittees, MemberWithCommittees, trades)
     
-    return trades
+    response = json_response(TRADE_WITH_MEMBER_AND_COMMITTEES_LIST_ADAPTER, result)
+    if len(trades) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(trades[-1].transaction_date, trades[-1].id)
+    
+    return response
 
-@router.get("/recent", response_model=List[TradeWithMember])
+@router.get("/recent", response_model=List[AnyTradeWithMember])
 async def get_recent_trades(
     days: int = Query(30, ge=1, le=365),
     limit: int = Query(50, ge=1, le=500),
@@ -104,13 +208,16 @@ async def get_recent_trades(
     """
     start_date = datetime.utcnow() - timedelta(days=days)
     
-    trades = db.query(Trade).join(Member).filter(
+    trades = db.query(Trade).options(selectinload(Trade.member)).filter(
         Trade.transaction_date >= start_date
     ).order_by(Trade.transaction_date.desc()).limit(limit).all()
     
-    return trades
+    return json_response(
+        TRADE_WITH_MEMBER_LIST_ADAPTER,
+        with_shared_members(TradeWithMember, MemberResponse, trades)
+    )
 
-@router.get("/by-member/{member_id}", response_model=List[TradeResponse])
+@router.get("/by-member/{member_id}", response_model=List[AnyTradeResponse])
 async def get_trades_by_member(
     member_id: int,
     skip: int = Query(0, ge=0),
@@ -120,13 +227,13 @@ async def get_trades_by_member(
     """
     Get all trades for a specific member
     """
-    trades = db.query(Trade).filter(
+    rows = db.query(*TRADE_RESPONSE_COLUMNS).filter(
         Trade.member_id == member_id
-    ).order_by(Trade.transaction_date.desc()).offset(skip).limit(limit).all()
+    ).order_by(Trade.transaction_date.desc()).offset(skip).limit(limit)
     
-    return trades
+    return ORJSONResponse(trade_row_dicts(rows))
 
-@router.get("/by-ticker/{ticker}", response_model=List[TradeWithMember])
+@router.get("/by-ticker/{ticker}", response_model=List[AnyTradeWithMember])
 async def get_trades_by_ticker(
     ticker: str,
     skip: int = Query(0, ge=0),
@@ -136,85 +243,97 @@ async def get_trades_by_ticker(
     """
     Get all trades for a specific stock ticker
     """
-    trades = db.query(Trade).join(Member).filter(
-        Trade.ticker.ilike(f"%{ticker.upper()}%")
+    trades = db.query(Trade).options(selectinload(Trade.member)).filter(
+        Trade.ticker == ticker.upper()
     ).order_by(Trade.transaction_date.desc()).offset(skip).limit(limit).all()
     
-    return trades
+    return json_response(
+        TRADE_WITH_MEMBER_LIST_ADAPTER,
+        with_shared_members(TradeWithMember, MemberResponse, trades)
+    )
 
 @router.get("/stats", response_model=DashboardStats)
 async def get_trading_stats(db: Session = Depends(get_db)):
     """
-    Get dashboard statistics
+    Get dashboard statistics, cached in memory for STATS_CACHE_TTL seconds
     """
-    # Total trades
-    total_trades = db.query(Trade).count()
-    
-    # Total members
-    total_members = db.query(Member).count()
+    global _stats_cache
+    if _stats_cache is None or _stats_cache[0] <= time.monotonic():
+        stats_json = DASHBOARD_STATS_ADAPTER.dump_json(compute_trading_stats(db))
+        _stats_cache = (time.monotonic() + STATS_CACHE_TTL, stats_json)
     
+    return Response(content=_stats_cache[1], media_type="application/json")
+
+def compute_trading_stats(db: Session) -> DashboardStats:
+    """
+    Compute dashboard statistics from the database
+    """
     # Total committees (placeholder - will be implemented when committee data is added)
     total_committees = 0
     
     # Recent trades (last 30 days)
     recent_date = datetime.utcnow() - timedelta(days=30)
-    recent_trades_count = db.query(Trade).filter(
-        Trade.transaction_date >= recent_date
-    ).count()
     
     # Top traded stocks
-    top_stocks = db.query(
+    top_stocks = select(
         Trade.ticker,
         func.count(Trade.id).label('trade_count')
     ).group_by(Trade.ticker).order_by(
         func.count(Trade.id).desc()
-    ).limit(10).all()
+    ).limit(10).subquery()
     
-    top_traded_stocks = [
-        {"ticker": stock.ticker, "trade_count": stock.trade_count}
-        for stock in top_stocks
-    ]
+    # Every statistic in a single round-trip, as (kind, key, count) rows
+    stats_rows = db.execute(union_all(
+        select(literal('total_trades'), null(), func.count(Trade.id)),
+        select(literal('total_members'), null(), func.count(Member.id)),
+        select(literal('recent_trades'), null(), func.count(Trade.id)).where(
+            Trade.transaction_date >= recent_date
+        ),
+        select(literal('ticker'), top_stocks.c.ticker, top_stocks.c.trade_count),
+        select(literal('chamber'), Member.chamber, func.count(Trade.id)).join_from(
+            Member, Trade
+        ).group_by(Member.chamber),
+        select(literal('party'), Member.party, func.count(Trade.id)).join_from(
+            Member, Trade
+        ).group_by(Member.party)
+    )).all()
     
-    # Trades by chamber
-    trades_by_chamber = db.query(
-        Member.chamber,
-        func.count(Trade.id).label('trade_count')
-    ).join(Trade).group_by(Member.chamber).all()
-    
-    trades_by_chamber_dict = {
-        chamber.chamber: chamber.trade_count
-        for chamber in trades_by_chamber
-    }
-    
-    # Trades by party
-    trades_by_party = db.query(
-        Member.party,
-        func.count(Trade.id).label('trade_count')
-    ).join(Trade).group_by(Member.party).all()
+    totals = {}
+    top_traded_stocks = []
+    trades_by_chamber_dict = {}
+    trades_by_party_dict = {}
+    for kind, key, count in stats_rows:
+        if kind == 'ticker':
+            top_traded_stocks.append({"ticker": key, "trade_count": count})
+        elif kind == 'chamber':
+            trades_by_chamber_dict[key] = count
+        elif kind == 'party':
+            trades_by_party_dict[key] = count
+        else:
+            totals[kind] = count
     
-    trades_by_party_dict = {
-        party.party: party.trade_count
-        for party in trades_by_party
-    }
+    # UNION ALL doesn't keep the subquery's ordering
+    top_traded_stocks.sort(key=lambda stock: stock["trade_count"], reverse=True)
     
-    return DashboardStats(
-        total_trades=total_trades,
-        total_members=total_members,
+    # Values come straight from aggregate queries, so skip re-validating them
+    return DashboardStats.model_construct(
+        total_trades=totals['total_trades'],
+        total_members=totals['total_members'],
         total_committees=total_committees,
-        recent_trades_count=recent_trades_count,
+        recent_trades_count=totals['recent_trades'],
         top_traded_stocks=top_traded_stocks,
         trades_by_chamber=trades_by_chamber_dict,
         trades_by_party=trades_by_party_dict
     )
 
-@router.get("/{trade_id}", response_model=TradeWithMember)
+@router.get("/{trade_id}", response_model=AnyTradeWithMember)
 async def get_trade(trade_id: int, db: Session = Depends(get_db)):
     """
     Get a specific trade by ID
     """
-    trade = db.query(Trade).join(Member).filter(Trade.id == trade_id).first()
+    trade = db.query(Trade).options(selectinload(Trade.member)).filter(Trade.id == trade_id).first()
     
     if not trade:
         raise HTTPException(status_code=404, detail="Trade not found")
     
-    return trade
+    return build_trade_response(TradeWithMember, trade)
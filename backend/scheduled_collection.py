@@ -12,7 +12,7 @@ import logging
 # Add the backend directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from database import SessionLocal
+from database import BulkSession
 from data_collector import collect_congress_data
 
 # Configure logging
@@ -30,7 +30,7 @@ async def scheduled_collection():
     """
     Run scheduled data collection
     """
-    db = SessionLocal()
+    db = BulkSession()
     
     try:
         logger.info("Starting scheduled data collection...")
@@ -54,6 +54,14 @@ def main():
     Main function for scheduled collection
     """
     print(f"Scheduled data collection started at {datetime.now()}")
+    
+    # libuv-based event loop where available; the default asyncio loop otherwise
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(scheduled_collection())
     print(f"Scheduled data collection completed at {datetime.now()}")
 
@@ -1,10 +1,86 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from datetime import datetime
-from typing import Optional, List
+from functools import lru_cache
+from typing import Any, Callable, Dict, Literal, Optional, List, Tuple, Union, get_args, get_origin
+
+class TrustedORMMixin:
+    """
+    Builds response models from ORM rows the database already type-checked, skipping validation
+    """
+    @classmethod
+    def from_orm_trusted(cls, obj: Any, **overrides: Any):
+        """
+        Construct from a trusted ORM object without validation; models with custom validators
+        are validated as usual. Keyword arguments replace attributes read from the object.
+        """
+        fields = _trusted_fields(cls)
+        if fields is None:
+            return cls.model_validate({
+                **{name: getattr(obj, name) for name in cls.model_fields if hasattr(obj, name)},
+                **overrides
+            })
+        
+        values = {}
+        for name, field, convert in fields:
+            if name in overrides:
+                values[name] = overrides[name]
+                continue
+            value = getattr(obj, name, _MISSING)
+            values[name] = field.get_default(call_default_factory=True) if value is _MISSING else convert(value)
+        return cls.model_construct(**values)
+
+# Marks attributes the ORM object doesn't have, so the field default applies
+_MISSING = object()
+
+def _identity(value: Any) -> Any:
+    return value
+
+def _trusted_converter(annotation: Any) -> Callable[[Any], Any]:
+    """
+    Converter for one field value: nested trusted models are constructed recursively
+    """
+    if isinstance(annotation, type) and issubclass(annotation, TrustedORMMixin):
+        return lambda value: None if value is None else annotation.from_orm_trusted(value)
+    if get_origin(annotation) is list:
+        (item_annotation,) = get_args(annotation)
+        if isinstance(item_annotation, type) and issubclass(item_annotation, TrustedORMMixin):
+            return lambda values: [item_annotation.from_orm_trusted(value) for value in values]
+    # Datetimes and strings pass through as-is: pydantic-core formats datetimes as fast as
+    # datetime.isoformat(), and typed str fields serialize faster than Any-typed ones
+    return _identity
+
+@lru_cache(maxsize=None)
+def _trusted_fields(model: type) -> Optional[Tuple]:
+    """
+    (name, field, converter) for each field of a model, or None if the model has custom validators
+    """
+    decorators = model.__pydantic_decorators__
+    if (decorators.validators or decorators.field_validators
+            or decorators.root_validators or decorators.model_validators):
+        return None
+    return tuple(
+        (name, field, _trusted_converter(field.annotation))
+        for name, field in model.model_fields.items()
+    )
+
+# Shared by input and base models: validators are built on first use, so models the API
+# never validates (request bodies, filters) cost nothing at startup
+SCHEMA_CONFIG = ConfigDict(defer_build=True)
+
+# Response models are read from ORM rows and built eagerly: pydantic-core falls back to a
+# served model's own serializer (e.g. when matching union members), so it can't be deferred.
+# They are frozen since one nested member response is shared by all of its trades.
+RESPONSE_CONFIG = ConfigDict(from_attributes=True, defer_build=False, frozen=True)
+
+# Chambers a member can sit in; committees may also be joint
+MemberChamber = Literal["House", "Senate"]
+CommitteeChamber = Literal["House", "Senate", "Joint"]
 
 class MemberBase(BaseModel):
+    model_config = SCHEMA_CONFIG
+    
     name: str
-    chamber: str  # "House" or "Senate"
+    chamber: MemberChamber
     state: str
     party: Optional[str] = None
     district: Optional[str] = None
@@ -17,18 +93,20 @@ class MemberBase(BaseModel):
 class MemberCreate(MemberBase):
     pass
 
-class MemberResponse(MemberBase):
+class MemberResponse(MemberBase, TrustedORMMixin):
     id: int
     created_at: datetime
     updated_at: datetime
+    trade_count: Optional[int] = None  # Only set by endpoints that aggregate trades
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 class CommitteeBase(BaseModel):
+    model_config = SCHEMA_CONFIG
+    
     name: str
     code: str
-    chamber: str  # "House", "Senate", or "Joint"
+    chamber: CommitteeChamber
     subcommittee: bool = False
     parent_committee_id: Optional[int] = None
     description: Optional[str] = None
@@ -36,15 +114,16 @@ class CommitteeBase(BaseModel):
 class CommitteeCreate(CommitteeBase):
     pass
 
-class CommitteeResponse(CommitteeBase):
+class CommitteeResponse(CommitteeBase, TrustedORMMixin):
     id: int
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 class CommitteeMembershipBase(BaseModel):
+    model_config = SCHEMA_CONFIG
+    
     member_id: int
     committee_id: int
     position: Optional[str] = None
@@ -54,64 +133,108 @@ class CommitteeMembershipBase(BaseModel):
 class CommitteeMembershipCreate(CommitteeMembershipBase):
     pass
 
-class CommitteeMembershipResponse(CommitteeMembershipBase):
+class CommitteeMembershipResponse(CommitteeMembershipBase, TrustedORMMixin):
     id: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
-class TradeBase(BaseModel):
+class TradeCoreFields(BaseModel):
+    model_config = SCHEMA_CONFIG
+    
     member_id: int
     ticker: str
     company_name: Optional[str] = None
     transaction_type: str  # "Buy", "Sell", "Exchange"
     transaction_date: datetime
-    amount_min: Optional[float] = None
-    amount_max: Optional[float] = None
-    amount_exact: Optional[float] = None
+    # Disclosed amounts are whole dollars
+    amount_min: Optional[int] = None
+    amount_max: Optional[int] = None
+    amount_exact: Optional[int] = None
+    
+    description: Optional[str] = None
+    source: Optional[str] = None
+    filing_date: Optional[datetime] = None
+
+class TradeExchangeFields(BaseModel):
+    model_config = SCHEMA_CONFIG
     
     # Exchange-specific fields
     exchange_from_ticker: Optional[str] = None
     exchange_from_company: Optional[str] = None
-    exchange_from_amount: Optional[float] = None
+    exchange_from_amount: Optional[int] = None
     exchange_ratio: Optional[float] = None
     exchange_reason: Optional[str] = None
-    
-    description: Optional[str] = None
-    source: Optional[str] = None
-    filing_date: Optional[datetime] = None
+
+class TradeBase(TradeExchangeFields, TradeCoreFields):
+    pass
 
 class TradeCreate(TradeBase):
     pass
 
-class TradeResponse(TradeBase):
+# Trade responses leave out the exchange fields, which are null unless the transaction is an
+# Exchange; Exchange* variants add them back and are built by build_trade_response
+class TradeResponse(TradeCoreFields, TrustedORMMixin):
     id: int
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
+
+class ExchangeTradeResponse(TradeExchangeFields, TradeResponse):
+    pass
 
 class TradeWithMember(TradeResponse):
     member: MemberResponse
 
+class ExchangeTradeWithMember(TradeExchangeFields, TradeWithMember):
+    pass
+
 class MemberWithCommittees(MemberResponse):
     committees: List[CommitteeResponse] = []
 
 class TradeWithMemberAndCommittees(TradeResponse):
     member: MemberWithCommittees
 
+class ExchangeTradeWithMemberAndCommittees(TradeExchangeFields, TradeWithMemberAndCommittees):
+    pass
+
+# Either variant of a trade response; exchange variants come first so serialization picks
+# them over the compact classes they extend
+AnyTradeResponse = Union[ExchangeTradeResponse, TradeResponse]
+AnyTradeWithMember = Union[ExchangeTradeWithMember, TradeWithMember]
+AnyTradeWithMemberAndCommittees = Union[ExchangeTradeWithMemberAndCommittees, TradeWithMemberAndCommittees]
+
+# Compact trade response class -> its variant carrying the exchange fields
+EXCHANGE_VARIANTS = {
+    TradeResponse: ExchangeTradeResponse,
+    TradeWithMember: ExchangeTradeWithMember,
+    TradeWithMemberAndCommittees: ExchangeTradeWithMemberAndCommittees,
+}
+
+def build_trade_response(model: type, trade: Any, **overrides: Any):
+    """
+    Construct a trade response from a trusted Trade row, using the model's exchange
+    variant for Exchange transactions
+    """
+    if trade.transaction_type == "Exchange":
+        model = EXCHANGE_VARIANTS[model]
+    return model.from_orm_trusted(trade, **overrides)
+
 class DashboardStats(BaseModel):
+    model_config = RESPONSE_CONFIG
+    
     total_trades: int
     total_members: int
     total_committees: int
     recent_trades_count: int
-    top_traded_stocks: List[dict]
+    top_traded_stocks: List[Dict[str, Any]]
     trades_by_chamber: dict
     trades_by_party: dict
 
 class TradeFilter(BaseModel):
+    model_config = SCHEMA_CONFIG
+    
     member_id: Optional[int] = None
     chamber: Optional[str] = None
     party: Optional[str] = None
@@ -123,3 +246,12 @@ class TradeFilter(BaseModel):
     max_amount: Optional[float] = None
     limit: Optional[int] = 100
     offset: Optional[int] = 0
+
+# List adapters built once at import, so list endpoints serialize a whole page in one call.
+# dump_json walks the list in place, so a Sequence[...] annotation would save no copy.
+MEMBER_LIST_ADAPTER = TypeAdapter(List[MemberResponse])
+COMMITTEE_LIST_ADAPTER = TypeAdapter(List[CommitteeResponse])
+COMMITTEE_MEMBERSHIP_LIST_ADAPTER = TypeAdapter(List[CommitteeMembershipResponse])
+TRADE_WITH_MEMBER_LIST_ADAPTER = TypeAdapter(List[AnyTradeWithMember])
+TRADE_WITH_MEMBER_AND_COMMITTEES_LIST_ADAPTER = TypeAdapter(List[AnyTradeWithMemberAndCommittees])
+DASHBOARD_STATS_ADAPTER = TypeAdapter(DashboardStats)
@@ -41,7 +41,7 @@ export interface Trade {
   amount_min?: number;
   amount_max?: number;
   amount_exact?: number;
-  // Exchange-specific fields
+  // Exchange-specific fields, only present on Exchange trades
   exchange_from_ticker?: string;
   exchange_from_company?: string;
   exchange_from_amount?: number;
@@ -75,6 +75,7 @@ export interface Member {
   bio?: string;
   created_at: string;
   updated_at: string;
+  trade_count?: number;
 }
 
 export interface Committee {